@@ -1,5 +1,5 @@
 """Adapter facade exposing individual tool integrations (CLaRA)."""
 
-from . import chktex, codespell, latexindent, languagetool, ollama, openai, vale
+from . import chktex, codespell, latexindent, languagetool, ollama, openai, runner, vale
 
-__all__ = ["chktex", "codespell", "latexindent", "languagetool", "ollama", "openai", "vale"]
+__all__ = ["chktex", "codespell", "latexindent", "languagetool", "ollama", "openai", "runner", "vale"]
@@ -1,38 +1,46 @@
 from __future__ import annotations
 
+import os
 import re
 import subprocess
 from pathlib import Path
 from typing import Iterable, List
 
+# Output format: filename:line:col:kind:num:msg
+_LINE_RE = re.compile(r"^(.*?):(\d+):(\d+):(Warning|Error):(\d+):(.*)$")
+
 
 def run(files: Iterable[Path], cfg) -> List[dict]:
     """Run chktex on files and parse output."""
     _ = cfg  # Config might be used for extra args later
     issues = []
-    
+    # os.fspath is a C builtin; materialize once so generators aren't consumed twice.
+    paths = [os.fspath(f) for f in files]
+    if not paths:
+        return []
+
     # We use a custom format to make parsing robust:
     # %f = file, %l = line, %c = col, %k = kind, %n = number, %m = message
     cmd = ["chktex", "-q", "-I", "-v0", "-l", "configs/.chktexrc", "-f%f:%l:%c:%k:%n:%m\n"]
-    cmd.extend(str(f) for f in files)
+    cmd.extend(paths)
 
     try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, check=False
+        # Stream stdout so parsing overlaps the subprocess instead of
+        # buffering the whole report first.
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
         )
     except FileNotFoundError:
         # If chktex is missing (e.g. local run without docker), warn or skip
         return [{"tool": "chktex", "severity": "error", "message": "chktex binary not found"}]
 
-    # Output format: filename:line:col:kind:num:msg
-    pattern = re.compile(r"^(.*?):(\d+):(\d+):(Warning|Error):(\d+):(.*)$")
-
-    for line in result.stdout.splitlines():
+    assert proc.stdout is not None
+    for line in proc.stdout:
         line = line.strip()
         if not line:
             continue
-        
-        match = pattern.match(line)
+
+        match = _LINE_RE.match(line)
         if match:
             fpath, l, c, kind, num, msg = match.groups()
             severity = "error" if kind == "Error" else "warning"
@@ -47,4 +55,5 @@ def run(files: Iterable[Path], cfg) -> List[dict]:
                 "message": msg.strip(),
             })
 
+    proc.wait()
     return issues
@@ -1,44 +1,43 @@
 from __future__ import annotations
 
+import os
 import re
 import subprocess
 from pathlib import Path
 from typing import Iterable, List
 
+# Output format: filename:line: typo ==> correction
+# Example: paper.tex:10: teh ==> the
+_LINE_RE = re.compile(r"^(.*?):(\d+):\s+(.*)$")
+
 
 def run(files: Iterable[Path], cfg) -> List[dict]:
     """Run codespell on files."""
     _ = cfg
     issues = []
-    file_list = [str(f) for f in files]
-
-    if not file_list:
+    paths = [os.fspath(f) for f in files]
+    if not paths:
         return []
 
     cmd = ["codespell"]
-    cmd.extend(file_list)
+    cmd.extend(paths)
 
     try:
-        # codespell returns non-zero if typos found
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, check=False
+        # codespell returns non-zero if typos found. Merge stderr into the
+        # stdout stream (usually stdout anyway) and parse lines as they arrive.
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
         )
     except FileNotFoundError:
         return [{"tool": "codespell", "severity": "error", "message": "codespell binary not found"}]
 
-    # Output format: filename:line: typo ==> correction
-    # Example: paper.tex:10: teh ==> the
-    pattern = re.compile(r"^(.*?):(\d+):\s+(.*)$")
-
-    # Combine stdout and stderr just in case, though usually stdout
-    output = result.stdout + result.stderr
-
-    for line in output.splitlines():
+    assert proc.stdout is not None
+    for line in proc.stdout:
         line = line.strip()
         if not line:
             continue
-            
-        match = pattern.match(line)
+
+        match = _LINE_RE.match(line)
         if match:
             fpath, lineno, msg = match.groups()
             issues.append({
@@ -50,4 +49,5 @@ def run(files: Iterable[Path], cfg) -> List[dict]:
                 "message": msg,
             })
 
+    proc.wait()
     return issues
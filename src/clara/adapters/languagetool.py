@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import bisect
+import functools
 import os
 import re
 import httpx
@@ -9,6 +11,33 @@ from typing import Iterable, List
 
 from pylatexenc.latex2text import LatexNodes2Text
 
+from .. import jsonio
+
+# The LT server handles several requests in parallel worker threads.
+_MAX_CONCURRENT_REQUESTS = 8
+
+_PUNCT_SPACE_RE = re.compile(r"\s+([.,;:!?])")
+_MULTISPACE_RE = re.compile(r"[ \t]{2,}")
+_SHORT_TOKEN_RE = re.compile(r"[a-zäöüß]{1,6}")
+_COMMENT_RE = re.compile(r"(?<!\\)%[^\n]*")
+_HAS_WORDS = re.compile(r"[A-Za-zÀ-ÿ]{4,}")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_lt_config(mtime: float) -> dict:
+    """Parse configs/languagetool.json once per mtime."""
+    _ = mtime  # cache key only
+    try:
+        return jsonio.loads(Path("configs/languagetool.json").read_bytes())
+    except ValueError:
+        return {}
+
+
+@functools.lru_cache(maxsize=4)
+def _get_converter(math_mode: str) -> LatexNodes2Text:
+    """Share converters across invocations; construction builds large macro tables."""
+    return LatexNodes2Text(math_mode=math_mode)
+
 
 def run(files: Iterable[Path], cfg, url_env: str | None = None) -> List[dict]:
     """Run LanguageTool checks via HTTP API."""
@@ -16,24 +45,24 @@ def run(files: Iterable[Path], cfg, url_env: str | None = None) -> List[dict]:
     if not base_url.endswith("/v2/check"):
         base_url = f"{base_url.rstrip('/')}/v2/check"
 
-    # Load LT config
+    # Load LT config (cached; re-read only when the file changes)
     lt_cfg_path = Path("configs/languagetool.json")
     disabled_rules = []
     enabled_rules = []
     ignore_words: List[str] = []
     if lt_cfg_path.exists():
-        try:
-            lt_json = json.loads(lt_cfg_path.read_text(encoding="utf-8"))
-            disabled_rules = lt_json.get("disabledRules", [])
-            enabled_rules = lt_json.get("enabledRules", [])
-            ignore_words = lt_json.get("ignoreWords", [])
-        except json.JSONDecodeError:
-            pass
+        lt_json = _load_lt_config(lt_cfg_path.stat().st_mtime)
+        disabled_rules = lt_json.get("disabledRules", [])
+        enabled_rules = lt_json.get("enabledRules", [])
+        ignore_words = lt_json.get("ignoreWords", [])
 
     issues = []
     # Convert math to empty text to avoid spelling noise from formulas.
-    converter = LatexNodes2Text(math_mode="remove")
+    converter = _get_converter("remove")
 
+    # Prepare all file payloads up front, then post them concurrently;
+    # ordering is preserved because results come back by list index.
+    prepared: List[tuple[Path, str, str]] = []  # (path, masked, plain_text)
     for path in files:
         try:
             content = path.read_text(encoding="utf-8")
@@ -43,6 +72,11 @@ def run(files: Iterable[Path], cfg, url_env: str | None = None) -> List[dict]:
         # Mask preamble/comments before conversion to reduce noise
         masked = _mask_preamble_and_comments(content)
 
+        # No prose words left after masking (figure-only files, pure code
+        # listings): skip the pylatexenc pass and the LT request entirely.
+        if not _HAS_WORDS.search(masked):
+            continue
+
         # Convert to plain text for LT
         try:
             plain_text = converter.latex_to_text(masked)
@@ -58,23 +92,34 @@ def run(files: Iterable[Path], cfg, url_env: str | None = None) -> List[dict]:
             plain_text = _mask_ignore_words(plain_text, ignore_words, replacement=replacement)
         plain_text = _cleanup_plain_text(plain_text)
 
-        params = {
+        prepared.append((path, masked, plain_text))
+
+    if not prepared:
+        return []
+
+    payloads = [
+        {
             "text": plain_text,
             "language": cfg.languages.primary,
             "disabledRules": ",".join(disabled_rules),
             "enabledRules": ",".join(enabled_rules),
         }
+        for _, _, plain_text in prepared
+    ]
 
-        try:
-            resp = httpx.post(base_url, data=params, timeout=10.0)
-            resp.raise_for_status()
-            data = resp.json()
-        except httpx.RequestError:
+    responses = asyncio.run(_post_all(base_url, payloads))
+
+    for (path, masked, plain_text), data in zip(prepared, responses):
+        if isinstance(data, httpx.RequestError):
             # If server is unreachable, we treat it as a note or skipped
             # For MVP, let's just log a single error issue
             return [{"tool": "languagetool", "severity": "error", "message": "Could not connect to LanguageTool server"}]
-        except Exception as e:
-            return [{"tool": "languagetool", "severity": "error", "message": str(e)}]
+        if isinstance(data, BaseException):
+            return [{"tool": "languagetool", "severity": "error", "message": str(data)}]
+
+        # Newline offsets computed once per file; each match maps its found
+        # offset to line/col with a bisect instead of re-scanning the prefix.
+        newline_positions = _newline_positions(masked)
 
         for match in data.get("matches", []):
             # context text is what LT saw. We try to find it in original content.
@@ -101,9 +146,12 @@ def run(files: Iterable[Path], cfg, url_env: str | None = None) -> List[dict]:
             found_idx = masked.find(error_segment)
             if found_idx != -1:
                 # Calculate line/col
-                preceding = masked[:found_idx]
-                line = preceding.count("\n") + 1
-                col = len(preceding.split("\n")[-1]) + 1
+                nl_before = bisect.bisect_left(newline_positions, found_idx)
+                line = nl_before + 1
+                if nl_before:
+                    col = found_idx - newline_positions[nl_before - 1]
+                else:
+                    col = found_idx + 1
             
             issues.append({
                 "tool": "languagetool",
@@ -120,6 +168,31 @@ def run(files: Iterable[Path], cfg, url_env: str | None = None) -> List[dict]:
     return issues
 
 
+async def _post_all(url: str, payloads: List[dict]) -> List:
+    """POST all payloads with bounded concurrency; exceptions are returned in place."""
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+    async with httpx.AsyncClient(limits=limits, timeout=10.0) as client:
+
+        async def _post(params: dict):
+            async with semaphore:
+                resp = await client.post(url, data=params)
+                resp.raise_for_status()
+                return resp.json()
+
+        return await asyncio.gather(*(_post(p) for p in payloads), return_exceptions=True)
+
+
+def _newline_positions(text: str) -> List[int]:
+    positions: List[int] = []
+    idx = text.find("\n")
+    while idx != -1:
+        positions.append(idx)
+        idx = text.find("\n", idx + 1)
+    return positions
+
+
 def _mask_preamble_and_comments(content: str) -> str:
     masked = _mask_comments(content)
 
@@ -139,52 +212,41 @@ def _mask_preamble_and_comments(content: str) -> str:
 
 
 def _mask_comments(text: str) -> str:
-    out_lines = []
-    for line in text.splitlines(keepends=True):
-        idx = _find_unescaped_percent(line)
-        if idx == -1:
-            out_lines.append(line)
-            continue
-        newline = "\n" if line.endswith("\n") else ""
-        visible = line[:idx]
-        masked = visible + (" " * (len(line) - idx - len(newline))) + newline
-        out_lines.append(masked)
-    return "".join(out_lines)
-
-
-def _find_unescaped_percent(line: str) -> int:
-    i = 0
-    while True:
-        idx = line.find("%", i)
-        if idx == -1:
-            return -1
-        if idx > 0 and line[idx - 1] == "\\":
-            i = idx + 1
-            continue
-        return idx
+    # One pass over the whole document; line structure is preserved because
+    # the match never crosses a newline.
+    return _COMMENT_RE.sub(lambda m: " " * len(m.group(0)), text)
 
 
 def _mask_non_newline(text: str) -> str:
-    return re.sub(r"[^\n]", " ", text)
+    # Pure C string ops beat the regex engine for this character-class swap.
+    return "\n".join(" " * len(part) for part in text.split("\n"))
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_ignore_pattern(words: tuple[str, ...]) -> re.Pattern | None:
+    """Build one alternation so the text is scanned once, not once per word."""
+    escaped = [re.escape(word) for word in words if word]
+    if not escaped:
+        return None
+    return re.compile("|".join(escaped))
 
 
 def _mask_ignore_words(text: str, words: List[str], replacement: str) -> str:
-    masked = text
-    for word in words:
-        if not word:
-            continue
-        masked = re.sub(re.escape(word), replacement, masked)
-    masked = re.sub(r"[ \t]{2,}", " ", masked)
+    pattern = _compile_ignore_pattern(tuple(words))
+    if pattern is None:
+        return text
+    masked = pattern.sub(replacement, text)
+    masked = _MULTISPACE_RE.sub(" ", masked)
     return masked
 
 
 def _cleanup_plain_text(text: str) -> str:
-    text = re.sub(r"\s+([.,;:!?])", r"\1", text)
+    text = _PUNCT_SPACE_RE.sub(r"\1", text)
     lines = text.splitlines()
     cleaned: List[str] = []
     for i, line in enumerate(lines):
         stripped = line.strip()
-        if re.fullmatch(r"[a-zäöüß]{1,6}", stripped):
+        if _SHORT_TOKEN_RE.fullmatch(stripped):
             prev_blank = i == 0 or not lines[i - 1].strip()
             next_blank = i == len(lines) - 1 or not lines[i + 1].strip()
             if prev_blank and next_blank:
@@ -1,50 +1,106 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import os
+import re
 import httpx
 from typing import Iterable, List
 
 from ..extract import Segment
 from ..prompts import load_prompt
+from .. import jsonio
+
+# Greedy span from the first '[' to the last ']' in one C-level scan.
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
 
 
 def run(segments: Iterable[Segment], cfg, url_env: str | None = None) -> List[dict]:
-    """Run LLM checks via Ollama."""
+    """Run LLM checks via Ollama, with bounded per-segment concurrency."""
+    min_chars = cfg.llm.min_segment_chars
+    # Caption/label-only segments aren't worth an LLM round-trip.
+    segment_list = [seg for seg in segments if len(seg.text.strip()) >= min_chars]
+    if not segment_list:
+        return []
+    return asyncio.run(_run_async(segment_list, cfg, url_env))
+
+
+async def _run_async(segments: List[Segment], cfg, url_env: str | None) -> List[dict]:
     base_url = os.getenv(url_env, "http://localhost:11434") if url_env else "http://localhost:11434"
     chat_url = f"{base_url.rstrip('/')}/api/chat"
     generate_url = f"{base_url.rstrip('/')}/api/generate"
 
     system_prompt = load_prompt("prompt_clarity", cfg, default="You are a helpful editor.")
+    timeout = cfg.llm.timeout_seconds or 60
+    semaphore = asyncio.Semaphore(cfg.llm.concurrency or 4)
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
 
-    issues = []
-
+    # Identical texts (shared boilerplate, repeated captions) go to the
+    # model once; results fan back out to every occurrence below.
+    unique: List[Segment] = []
+    duplicates: dict[str, List[Segment]] = {}
     for seg in segments:
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": seg.text},
-        ]
-        
-        options = {}
-        if cfg.llm.temperature is not None:
-            options["temperature"] = cfg.llm.temperature
-        if cfg.llm.max_tokens is not None:
-            options["num_predict"] = cfg.llm.max_tokens
-
-        chat_payload = {
-            "model": cfg.llm.model,
-            "messages": messages,
-            "stream": False,
-            "format": "json",
-        }
-        
-        if options:
-            chat_payload["options"] = options
-
-        try:
-            timeout = cfg.llm.timeout_seconds or 60
+        if seg.text in duplicates:
+            duplicates[seg.text].append(seg)
+        else:
+            duplicates[seg.text] = []
+            unique.append(seg)
+
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+        results = await asyncio.gather(
+            *(
+                _check_segment(client, semaphore, seg, cfg, system_prompt, chat_url, generate_url)
+                for seg in unique
+            )
+        )
+
+    issues: List[dict] = []
+    for seg, seg_issues in zip(unique, results):
+        issues.extend(seg_issues)
+        for dup in duplicates[seg.text]:
+            for issue in seg_issues:
+                if "file" not in issue:
+                    continue  # transport errors are reported once, not per copy
+                copy = dict(issue)
+                copy["file"] = dup.file
+                copy["line"] = dup.start_line
+                issues.append(copy)
+    return issues
+
+
+async def _check_segment(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    seg: Segment,
+    cfg,
+    system_prompt: str,
+    chat_url: str,
+    generate_url: str,
+) -> List[dict]:
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": seg.text},
+    ]
+
+    options = {}
+    if cfg.llm.temperature is not None:
+        options["temperature"] = cfg.llm.temperature
+    if cfg.llm.max_tokens is not None:
+        options["num_predict"] = cfg.llm.max_tokens
+
+    chat_payload = {
+        "model": cfg.llm.model,
+        "messages": messages,
+        "stream": False,
+        "format": "json",
+    }
+
+    if options:
+        chat_payload["options"] = options
+
+    try:
+        async with semaphore:
             try:
-                resp = httpx.post(chat_url, json=chat_payload, timeout=timeout)
+                resp = await client.post(chat_url, json=chat_payload)
                 resp.raise_for_status()
                 result = resp.json()
                 content = result.get("message", {}).get("content", "")
@@ -61,33 +117,33 @@ def run(segments: Iterable[Segment], cfg, url_env: str | None = None) -> List[di
                 }
                 if options:
                     gen_payload["options"] = options
-                resp = httpx.post(generate_url, json=gen_payload, timeout=timeout)
+                resp = await client.post(generate_url, json=gen_payload)
                 resp.raise_for_status()
                 result = resp.json()
                 content = result.get("response", "")
-            
-            # Parse JSON from content
-            suggestions = _parse_json_list(content)
-            for item in suggestions:
-                if not isinstance(item, dict):
-                    continue
-                issues.append({
-                    "tool": "llm",
-                    "type": "clarity",
-                    "file": seg.file,
-                    "line": seg.start_line,  # logical start of chunk
-                    "severity": "note",
-                    "message": item.get("rationale", "Suggestion"),
-                    "suggestion": item.get("suggestion", ""),
-                })
-
-        except Exception as e:
-            issues.append({
-                "tool": "llm",
-                "severity": "error",
-                "message": f"Ollama error: {str(e)}"
-            })
-            
+    except Exception as e:
+        # A failed segment must not abort the rest of the batch.
+        return [{
+            "tool": "llm",
+            "severity": "error",
+            "message": f"Ollama error: {str(e)}"
+        }]
+
+    issues: List[dict] = []
+    # Parse JSON from content
+    suggestions = _parse_json_list(content)
+    for item in suggestions:
+        if not isinstance(item, dict):
+            continue
+        issues.append({
+            "tool": "llm",
+            "type": "clarity",
+            "file": seg.file,
+            "line": seg.start_line,  # logical start of chunk
+            "severity": "note",
+            "message": item.get("rationale", "Suggestion"),
+            "suggestion": item.get("suggestion", ""),
+        })
     return issues
 
 
@@ -95,7 +151,7 @@ def _parse_json_list(content: str) -> list:
     if not content:
         return []
     try:
-        data = json.loads(content)
+        data = jsonio.loads(content)
         if isinstance(data, list):
             return data
         if isinstance(data, dict):
@@ -103,14 +159,15 @@ def _parse_json_list(content: str) -> list:
                 value = data.get(key)
                 if isinstance(value, list):
                     return value
-    except json.JSONDecodeError:
+    except ValueError:
         pass
 
     # Try to recover the first JSON array from a response with extra text / fences.
+    match = _JSON_ARRAY_RE.search(content)
+    if not match:
+        return []
     try:
-        start = content.index("[")
-        end = content.rindex("]") + 1
-        data = json.loads(content[start:end])
+        data = jsonio.loads(match.group())
         return data if isinstance(data, list) else []
-    except (ValueError, json.JSONDecodeError):
+    except ValueError:
         return []
@@ -1,102 +1,160 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import os
+import re
 import httpx
 from typing import Iterable, List
 
 from ..extract import Segment
 from ..prompts import load_prompt
+from .. import jsonio
+
+# Greedy span from the first '[' to the last ']' in one C-level scan.
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
 
 
 def run(segments: Iterable[Segment], cfg, url_env: str | None = None) -> List[dict]:
     """Run LLM checks via OpenAI-compatible API (e.g. LM Studio)."""
+    min_chars = cfg.llm.min_segment_chars
+    # Caption/label-only segments aren't worth an LLM round-trip.
+    segment_list = [seg for seg in segments if len(seg.text.strip()) >= min_chars]
+    if not segment_list:
+        return []
+    return asyncio.run(_run_async(segment_list, cfg, url_env))
+
+
+async def _run_async(segments: List[Segment], cfg, url_env: str | None) -> List[dict]:
     # Use config api_url if provided, else check env, else default LM Studio
     base_url = cfg.llm.api_url or os.getenv(url_env, "http://localhost:1234/v1")
     url = f"{base_url.rstrip('/')}/chat/completions"
 
     system_prompt = load_prompt("prompt_clarity", cfg, default="You are a helpful editor.")
 
-    issues = []
+    # We don't use API key for local LM Studio by default
+    headers = {}
+    api_key = os.getenv("OPENAI_API_KEY")
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+
+    timeout = cfg.llm.timeout_seconds or 60
+    semaphore = asyncio.Semaphore(cfg.llm.concurrency or 4)
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
 
+    # Identical texts (shared boilerplate, repeated captions) go to the
+    # model once; results fan back out to every occurrence below.
+    unique: List[Segment] = []
+    duplicates: dict[str, List[Segment]] = {}
     for seg in segments:
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": seg.text},
-        ]
-        
-        payload = {
-            "model": cfg.llm.model,
-            "messages": messages,
-            "stream": False,
-        }
-        
-        if cfg.llm.temperature is not None:
-            payload["temperature"] = cfg.llm.temperature
-        if cfg.llm.max_tokens is not None:
-            payload["max_tokens"] = cfg.llm.max_tokens
-
-        try:
-            # We don't use API key for local LM Studio by default
-            headers = {}
-            api_key = os.getenv("OPENAI_API_KEY")
-            if api_key:
-                headers["Authorization"] = f"Bearer {api_key}"
-
-            timeout = cfg.llm.timeout_seconds or 60
-            resp = httpx.post(url, json=payload, headers=headers, timeout=timeout)
+        if seg.text in duplicates:
+            duplicates[seg.text].append(seg)
+        else:
+            duplicates[seg.text] = []
+            unique.append(seg)
+
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+        results = await asyncio.gather(
+            *(
+                _check_segment(client, semaphore, seg, cfg, system_prompt, url, headers)
+                for seg in unique
+            )
+        )
+
+    issues: List[dict] = []
+    for seg, seg_issues in zip(unique, results):
+        issues.extend(seg_issues)
+        for dup in duplicates[seg.text]:
+            for issue in seg_issues:
+                if "file" not in issue:
+                    continue  # transport errors are reported once, not per copy
+                copy = dict(issue)
+                copy["file"] = dup.file
+                copy["line"] = dup.start_line
+                issues.append(copy)
+    return issues
+
+
+async def _check_segment(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    seg: Segment,
+    cfg,
+    system_prompt: str,
+    url: str,
+    headers: dict,
+) -> List[dict]:
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": seg.text},
+    ]
+
+    payload = {
+        "model": cfg.llm.model,
+        "messages": messages,
+        "stream": False,
+    }
+
+    if cfg.llm.temperature is not None:
+        payload["temperature"] = cfg.llm.temperature
+    if cfg.llm.max_tokens is not None:
+        payload["max_tokens"] = cfg.llm.max_tokens
+
+    try:
+        async with semaphore:
+            resp = await client.post(url, json=payload, headers=headers)
             resp.raise_for_status()
-            result = resp.json()
-            content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
-            
-            suggestions = None
-            # Parse JSON from content
+        result = resp.json()
+        content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+    except Exception as e:
+        # A failed segment must not abort the rest of the batch.
+        return [{
+            "tool": "llm",
+            "severity": "error",
+            "message": f"OpenAI/LMStudio error: {str(e)}"
+        }]
+
+    suggestions = None
+    # Parse JSON from content
+    try:
+        suggestions = jsonio.loads(content)
+    except ValueError:
+        # Try to extract JSON list if model included extra text (e.g. thinking blocks)
+        match = _JSON_ARRAY_RE.search(content)
+        if match:
             try:
-                suggestions = json.loads(content)
-            except json.JSONDecodeError:
-                # Try to extract JSON list if model included extra text (e.g. thinking blocks)
-                try:
-                    start = content.index('[')
-                    end = content.rindex(']') + 1
-                    suggestions = json.loads(content[start:end])
-                except (ValueError, json.JSONDecodeError):
-                    # If extraction fails, log and skip
-                    pass
-
-            if suggestions:
-                # Should be a list of dicts (the prompt asks for a list)
-                # Sometimes OpenAI returns { "suggestions": [...] }
-                if isinstance(suggestions, dict) and "suggestions" in suggestions:
-                    suggestions = suggestions["suggestions"]
-                
-                if isinstance(suggestions, list):
-                    for item in suggestions:
-                        if isinstance(item, str):
-                            issues.append({
-                                "tool": "llm",
-                                "type": "clarity",
-                                "file": seg.file,
-                                "line": seg.start_line,
-                                "severity": "note",
-                                "message": "Suggestion",
-                                "suggestion": item,
-                            })
-                            continue
-                        issues.append({
-                            "tool": "llm",
-                            "type": "clarity",
-                            "file": seg.file,
-                            "line": seg.start_line,
-                            "severity": "note",
-                            "message": item.get("rationale", "Suggestion"),
-                            "suggestion": item.get("suggestion", ""),
-                        })
-
-        except Exception as e:
-            issues.append({
-                "tool": "llm",
-                "severity": "error",
-                "message": f"OpenAI/LMStudio error: {str(e)}"
-            })
-            
+                suggestions = jsonio.loads(match.group())
+            except ValueError:
+                # If extraction fails, log and skip
+                pass
+
+    issues: List[dict] = []
+    if suggestions:
+        # Should be a list of dicts (the prompt asks for a list)
+        # Sometimes OpenAI returns { "suggestions": [...] }
+        if isinstance(suggestions, dict) and "suggestions" in suggestions:
+            suggestions = suggestions["suggestions"]
+
+        if isinstance(suggestions, list):
+            for item in suggestions:
+                if isinstance(item, str):
+                    issues.append({
+                        "tool": "llm",
+                        "type": "clarity",
+                        "file": seg.file,
+                        "line": seg.start_line,
+                        "severity": "note",
+                        "message": "Suggestion",
+                        "suggestion": item,
+                    })
+                    continue
+                issues.append({
+                    "tool": "llm",
+                    "type": "clarity",
+                    "file": seg.file,
+                    "line": seg.start_line,
+                    "severity": "note",
+                    "message": item.get("rationale", "Suggestion"),
+                    "suggestion": item.get("suggestion", ""),
+                })
+
     return issues
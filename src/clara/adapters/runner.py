@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, List, Sequence
+
+
+def run_all(checkers: Sequence[Callable], files: Iterable, cfg) -> List[dict]:
+    """Run several adapter ``run(files, cfg)`` callables concurrently.
+
+    Each adapter blocks on an external binary (subprocess) or HTTP round-trip,
+    so the GIL is released while waiting and threads are sufficient. Results
+    are merged in the order the checkers were passed in, so output stays
+    deterministic regardless of completion order.
+
+    Adapters are expected to pass the whole file list to a single tool
+    invocation (chktex, codespell and vale all do) rather than spawning one
+    subprocess per file; latexindent is the lone exception because the tool
+    has no multi-file check mode, and it fans out internally instead.
+    """
+    checkers = list(checkers)
+    if not checkers:
+        return []
+    # Materialize once so a generator isn't consumed by the first adapter.
+    file_list = list(files)
+
+    results: dict[int, List[dict]] = {}
+    with ThreadPoolExecutor(max_workers=len(checkers)) as executor:
+        futures = {
+            executor.submit(checker, file_list, cfg): idx
+            for idx, checker in enumerate(checkers)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    issues: List[dict] = []
+    for idx in range(len(checkers)):
+        issues.extend(results.get(idx, []))
+    return issues
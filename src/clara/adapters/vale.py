@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
+import tempfile
 from pathlib import Path
 from typing import Iterable, List
 
@@ -10,29 +12,39 @@ def run(files: Iterable[Path], cfg) -> List[dict]:
     """Run vale on files and parse JSON output."""
     _ = cfg
     issues = []
-    file_list = [str(f) for f in files]
-    
-    if not file_list:
+    paths = [os.fspath(f) for f in files]
+    if not paths:
         return []
 
     # --no-exit ensures vale returns 0 even if errors found (we parse stdout)
     cmd = ["vale", "--no-exit", "--output=JSON", "--config=configs/vale.ini"]
-    cmd.extend(file_list)
-
-    try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, check=False
-        )
-    except FileNotFoundError:
-        return [{"tool": "vale", "severity": "error", "message": "vale binary not found"}]
-
-    try:
-        data = json.loads(result.stdout)
-    except json.JSONDecodeError:
-        # Fallback if vale fails or outputs non-JSON (e.g. config error)
-        if result.stderr:
-            return [{"tool": "vale", "severity": "error", "message": f"Vale execution failed: {result.stderr.strip()}"}]
-        return []
+    cmd.extend(paths)
+
+    # stderr goes to an unnamed temp file rather than a pipe: stdout is
+    # parsed to EOF first, and an undrained stderr pipe would deadlock
+    # both processes once vale filled the OS pipe buffer.
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as stderr_buf:
+        try:
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=stderr_buf, text=True
+            )
+        except FileNotFoundError:
+            return [{"tool": "vale", "severity": "error", "message": "vale binary not found"}]
+
+        assert proc.stdout is not None
+        try:
+            # Parse directly from the pipe instead of materializing stdout as one str.
+            data = json.load(proc.stdout)
+        except json.JSONDecodeError:
+            # Fallback if vale fails or outputs non-JSON (e.g. config error)
+            proc.wait()
+            stderr_buf.seek(0)
+            stderr = stderr_buf.read()
+            if stderr:
+                return [{"tool": "vale", "severity": "error", "message": f"Vale execution failed: {stderr.strip()}"}]
+            return []
+        finally:
+            proc.wait()
 
     for filename, checks in data.items():
         for check in checks:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-import json
+import atexit
+import functools
 import os
+import re
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
 
@@ -9,33 +11,108 @@ import httpx
 
 from .config import ClaraConfig
 from .prompts import load_prompt, spellcheck_fix_prompt
+from . import jsonio
+
+# Greedy span from the first '{' to the last '}' in one C-level scan.
+_JSON_OBJ_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+_CLIENT = httpx.Client(limits=httpx.Limits(max_connections=32, max_keepalive_connections=16))
+atexit.register(_CLIENT.close)
 
 
 def adjudicate_issues(issues: Iterable[Dict[str, Any]], cfg: ClaraConfig) -> List[Dict[str, Any]]:
     """Use LLM to accept/reject tool issues and optionally provide fixes."""
     system_prompt = load_prompt("prompt_adjudicate", cfg, default="")
 
-    results: List[Dict[str, Any]] = []
-    for issue in issues:
-        if issue.get("tool") == "llm":
-            results.append(issue)
-            continue
+    all_issues = list(issues)
+    pending = [issue for issue in all_issues if issue.get("tool") != "llm"]
+
+    batch_size = max(1, cfg.llm.batch_size or 8)
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start : start + batch_size]
+        line_texts = [
+            _read_line(issue.get("file"), int(issue.get("line", 0) or 0))
+            for issue in batch
+        ]
+
+        decisions = None
+        if len(batch) > 1:
+            decisions = _adjudicate_batch(batch, line_texts, cfg, system_prompt)
+        if decisions is None:
+            # Single issue, or the batch response didn't parse: per-issue path.
+            decisions = [
+                _call_adjudicator(issue, line_text, cfg, system_prompt)
+                for issue, line_text in zip(batch, line_texts)
+            ]
+        else:
+            decisions = [
+                _finalize_decision(issue, line_text, cfg, decision)
+                for issue, line_text, decision in zip(batch, line_texts, decisions)
+            ]
+
+        for issue, decision in zip(batch, decisions):
+            issue["adjudication"] = decision
 
-        file_path = issue.get("file")
-        line_no = int(issue.get("line", 0) or 0)
-        line_text = _read_line(file_path, line_no)
+    return all_issues
 
-        decision = _call_adjudicator(issue, line_text, cfg, system_prompt)
-        issue["adjudication"] = decision
-        results.append(issue)
-    return results
+
+def _adjudicate_batch(
+    batch: List[Dict[str, Any]],
+    line_texts: List[str],
+    cfg: ClaraConfig,
+    system_prompt: str,
+) -> List[Dict[str, Any]] | None:
+    """Adjudicate several issues in one LLM round-trip.
+
+    Returns None when the response doesn't parse into one decision per issue,
+    in which case the caller falls back to per-issue calls.
+    """
+    payload = {
+        "issues": [
+            {"issue": _issue_payload(issue), "line": line_text}
+            for issue, line_text in zip(batch, line_texts)
+        ]
+    }
+    # The system prompt describes the single-issue reply shape, so the
+    # batch contract has to travel with the request itself (same pattern
+    # as the fixer's batched prompt).
+    user_msg = (
+        "Adjudicate each issue in the JSON below. Reply with exactly one "
+        'JSON object {"decisions": [...]} containing one decision object '
+        '{"accept": ..., "fix": ..., "comment": ...} per issue, in input '
+        "order, and nothing else.\n\n" + jsonio.dumps(payload)
+    )
+
+    try:
+        if cfg.llm.provider == "ollama":
+            content = _call_ollama(system_prompt, user_msg, cfg)
+        else:
+            content = _call_openai(system_prompt, user_msg, cfg)
+    except Exception:
+        return None
+
+    parsed = _parse_json_object(content)
+    if parsed is None:
+        return None
+    decisions = parsed.get("decisions")
+    if not isinstance(decisions, list) or len(decisions) != len(batch):
+        return None
+    if not all(isinstance(d, dict) for d in decisions):
+        return None
+    return decisions
+
+
+@functools.lru_cache(maxsize=64)
+def _read_file_lines(path: str, mtime: float) -> tuple[str, ...]:
+    _ = mtime  # cache key only; invalidates when the file changes
+    return tuple(Path(path).read_text(encoding="utf-8").splitlines())
 
 
 def _read_line(file_path: str | None, line_no: int) -> str:
     if not file_path or line_no <= 0:
         return ""
     try:
-        lines = Path(file_path).read_text(encoding="utf-8").splitlines()
+        lines = _read_file_lines(file_path, os.stat(file_path).st_mtime)
     except FileNotFoundError:
         return ""
     if line_no > len(lines):
@@ -43,25 +120,37 @@ def _read_line(file_path: str | None, line_no: int) -> str:
     return lines[line_no - 1]
 
 
+def _issue_payload(issue: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "tool": issue.get("tool"),
+        "type": issue.get("type"),
+        "message": issue.get("message"),
+        "code": issue.get("code"),
+        "suggestion": issue.get("suggestion"),
+    }
+
+
 def _call_adjudicator(issue: Dict[str, Any], line_text: str, cfg: ClaraConfig, system_prompt: str) -> Dict[str, Any]:
     payload = {
-        "issue": {
-            "tool": issue.get("tool"),
-            "type": issue.get("type"),
-            "message": issue.get("message"),
-            "code": issue.get("code"),
-            "suggestion": issue.get("suggestion"),
-        },
+        "issue": _issue_payload(issue),
         "line": line_text,
     }
-    user_msg = json.dumps(payload, ensure_ascii=False)
+    user_msg = jsonio.dumps(payload)
 
     if cfg.llm.provider == "ollama":
         content = _call_ollama(system_prompt, user_msg, cfg)
     else:
         content = _call_openai(system_prompt, user_msg, cfg)
 
-    decision = _parse_json_object(content)
+    return _finalize_decision(issue, line_text, cfg, _parse_json_object(content))
+
+
+def _finalize_decision(
+    issue: Dict[str, Any],
+    line_text: str,
+    cfg: ClaraConfig,
+    decision: Dict[str, Any] | None,
+) -> Dict[str, Any]:
     if decision is None:
         decision = {"accept": True}
 
@@ -96,7 +185,7 @@ def _call_spellcheck_fix_only(issue: Dict[str, Any], line_text: str, cfg: ClaraC
         "suggestion": issue.get("suggestion"),
         "line": line_text,
     }
-    user_msg = json.dumps(payload, ensure_ascii=False)
+    user_msg = jsonio.dumps(payload)
 
     try:
         if cfg.llm.provider == "ollama":
@@ -138,7 +227,7 @@ def _call_openai(system_prompt: str, user_msg: str, cfg: ClaraConfig) -> str:
         headers["Authorization"] = f"Bearer {api_key}"
 
     timeout = cfg.llm.timeout_seconds or 60
-    resp = httpx.post(url, json=payload, headers=headers, timeout=timeout)
+    resp = _CLIENT.post(url, json=payload, headers=headers, timeout=timeout)
     resp.raise_for_status()
     result = resp.json()
     return result.get("choices", [{}])[0].get("message", {}).get("content", "")
@@ -173,7 +262,7 @@ def _call_ollama(system_prompt: str, user_msg: str, cfg: ClaraConfig) -> str:
         chat_payload["options"] = options
 
     try:
-        resp = httpx.post(chat_url, json=chat_payload, timeout=timeout)
+        resp = _CLIENT.post(chat_url, json=chat_payload, timeout=timeout)
         resp.raise_for_status()
         result = resp.json()
         return result.get("message", {}).get("content", "")
@@ -191,7 +280,7 @@ def _call_ollama(system_prompt: str, user_msg: str, cfg: ClaraConfig) -> str:
     if options:
         gen_payload["options"] = options
 
-    resp = httpx.post(generate_url, json=gen_payload, timeout=timeout)
+    resp = _CLIENT.post(generate_url, json=gen_payload, timeout=timeout)
     resp.raise_for_status()
     result = resp.json()
     return result.get("response", "")
@@ -201,17 +290,18 @@ def _parse_json_object(content: str) -> Dict[str, Any] | None:
     if not content:
         return None
     try:
-        data = json.loads(content)
+        data = jsonio.loads(content)
         if isinstance(data, dict):
             return data
-    except json.JSONDecodeError:
+    except ValueError:
         pass
+    match = _JSON_OBJ_RE.search(content)
+    if not match:
+        return None
     try:
-        start = content.index("{")
-        end = content.rindex("}") + 1
-        data = json.loads(content[start:end])
+        data = jsonio.loads(match.group())
         if isinstance(data, dict):
             return data
-    except (ValueError, json.JSONDecodeError):
+    except ValueError:
         return None
     return None
@@ -3,22 +3,51 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import mmap
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
+from . import jsonio
+
+try:
+    import xxhash as _xxhash
+except ImportError:
+    _xxhash = None
+
+# Bound once: the compute_* hot paths call these per line/file, and a
+# module-level name skips the attribute lookup on every call.
+_sha256 = hashlib.sha256
+_xxh3_64 = _xxhash.xxh3_64 if _xxhash is not None else None
+_xxh3_128 = _xxhash.xxh3_128 if _xxhash is not None else None
+
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
 if TYPE_CHECKING:
     from .extract import Segment
 
-CACHE_VERSION = "1.1"
+CACHE_VERSION = "1.4"
 DEFAULT_CACHE_PATH = Path("out/.review_cache.json")
 
+# Above this size the cache JSON is parsed straight out of a memory map
+# instead of being read into a bytes object first.
+_MMAP_THRESHOLD = 10 * 1024 * 1024
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CachedIssue:
-    """Issue stored in cache, without file/line (those are the keys)."""
+    """Issue stored in cache, without file/line (those are the keys).
+
+    Instances are immutable and usually shared: identical issues repeated
+    across many lines (typical linter noise) are interned through
+    _intern_issue so the cache holds one object per distinct issue.
+    """
 
     tool: str
     type: str
@@ -28,47 +57,41 @@ class CachedIssue:
     code: Optional[str] = None
     suggestion: Optional[str] = None
     adjudication: Optional[Dict[str, Any]] = None
+    # Dict template built once; to_dict/to_full_issue copy it instead of
+    # reassembling the same keys for every carried-over issue.
+    _base: Dict[str, Any] = field(init=False, repr=False, compare=False)
 
-    def to_full_issue(self, file: str, line: int) -> Dict[str, Any]:
-        """Reconstruct full issue dict for merging with fresh issues."""
-        issue: Dict[str, Any] = {
+    def __post_init__(self) -> None:
+        base: Dict[str, Any] = {
             "tool": self.tool,
             "type": self.type,
-            "file": file,
-            "line": line,
             "col": self.col,
             "severity": self.severity,
             "message": self.message,
         }
         if self.code:
-            issue["code"] = self.code
+            base["code"] = self.code
         if self.suggestion:
-            issue["suggestion"] = self.suggestion
+            base["suggestion"] = self.suggestion
         if self.adjudication:
-            issue["adjudication"] = self.adjudication
+            base["adjudication"] = self.adjudication
+        object.__setattr__(self, "_base", base)
+
+    def to_full_issue(self, file: str, line: int) -> Dict[str, Any]:
+        """Reconstruct full issue dict for merging with fresh issues."""
+        issue = self._base.copy()
+        issue["file"] = file
+        issue["line"] = line
         return issue
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dict for JSON storage."""
-        d: Dict[str, Any] = {
-            "tool": self.tool,
-            "type": self.type,
-            "col": self.col,
-            "severity": self.severity,
-            "message": self.message,
-        }
-        if self.code:
-            d["code"] = self.code
-        if self.suggestion:
-            d["suggestion"] = self.suggestion
-        if self.adjudication:
-            d["adjudication"] = self.adjudication
-        return d
+        return self._base.copy()
 
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "CachedIssue":
         """Deserialize from dict."""
-        return cls(
+        return _intern_issue(
             tool=d["tool"],
             type=d["type"],
             col=d.get("col", 0),
@@ -80,30 +103,49 @@ class CachedIssue:
         )
 
 
-@dataclass
-class CachedLine:
-    """State of a single line in the cache."""
+# Flyweight pool: identical issues share one CachedIssue. Cleared after
+# save_cache so the pool doesn't outlive a run.
+_ISSUE_POOL: Dict[tuple, CachedIssue] = {}
 
-    content_hash: str
-    issues: List[CachedIssue] = field(default_factory=list)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dict."""
-        return {
-            "content_hash": self.content_hash,
-            "issues": [i.to_dict() for i in self.issues],
-        }
+def _intern_issue(
+    tool: str,
+    type: str,
+    col: int,
+    severity: str,
+    message: str,
+    code: Optional[str] = None,
+    suggestion: Optional[str] = None,
+    adjudication: Optional[Dict[str, Any]] = None,
+) -> CachedIssue:
+    """Return a shared CachedIssue for identical field values.
 
-    @classmethod
-    def from_dict(cls, d: Dict[str, Any]) -> "CachedLine":
-        """Deserialize from dict."""
-        return cls(
-            content_hash=d["content_hash"],
-            issues=[CachedIssue.from_dict(i) for i in d.get("issues", [])],
-        )
+    Issues carrying an adjudication dict bypass the pool (the dict isn't
+    hashable and those issues are rarely duplicated anyway).
+    """
+    if adjudication:
+        return CachedIssue(tool, type, col, severity, message, code, suggestion, adjudication)
+    key = (tool, type, col, severity, message, code, suggestion)
+    issue = _ISSUE_POOL.get(key)
+    if issue is None:
+        issue = CachedIssue(tool, type, col, severity, message, code, suggestion)
+        _ISSUE_POOL[key] = issue
+    return issue
 
 
-@dataclass
+@dataclass(slots=True)
+class CachedLine:
+    """State of a single line in the cache.
+
+    Serialized column-wise by CachedFile (hash array + sparse issue map),
+    so there is no per-line to_dict/from_dict.
+    """
+
+    content_hash: int
+    issues: List[CachedIssue] = field(default_factory=list)
+
+
+@dataclass(slots=True)
 class CachedSegment:
     """State of an LLM-reviewed segment in the cache."""
 
@@ -129,97 +171,269 @@ class CachedSegment:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedFile:
     """State of a file in the cache."""
 
     file_hash: str
     line_count: int
-    lines: Dict[int, CachedLine] = field(default_factory=dict)
+    # Dense: index i holds line i+1. Line numbers are always 1..line_count
+    # with no gaps, so a list beats a dict both on memory and lookup cost.
+    lines: List[CachedLine] = field(default_factory=list)
     segments: Dict[str, CachedSegment] = field(default_factory=dict)  # segment_hash → CachedSegment
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dict."""
+        """Serialize to dict.
+
+        Lines are stored column-wise: a dense "line_hashes" array parallel
+        to line numbers 1..line_count, plus a sparse "line_issues" map for
+        the (few) lines that actually carry issues. This avoids repeating
+        per-line field names in the JSON for every issue-free line.
+        """
         return {
             "file_hash": self.file_hash,
             "line_count": self.line_count,
-            "lines": {str(k): v.to_dict() for k, v in self.lines.items()},
+            "line_hashes": [f"{line.content_hash:016x}" for line in self.lines],
+            "line_issues": {
+                str(no): [i.to_dict() for i in line.issues]
+                for no, line in enumerate(self.lines, start=1)
+                if line.issues
+            },
             "segments": {k: v.to_dict() for k, v in self.segments.items()},
         }
 
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "CachedFile":
         """Deserialize from dict."""
+        lines = [CachedLine(content_hash=int(h, 16)) for h in d.get("line_hashes", [])]
+        for no_str, issue_dicts in d.get("line_issues", {}).items():
+            lines[int(no_str) - 1].issues = [CachedIssue.from_dict(i) for i in issue_dicts]
         return cls(
             file_hash=d["file_hash"],
             line_count=d["line_count"],
-            lines={int(k): CachedLine.from_dict(v) for k, v in d.get("lines", {}).items()},
+            lines=lines,
             segments={k: CachedSegment.from_dict(v) for k, v in d.get("segments", {}).items()},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewCache:
-    """Top-level cache structure."""
+    """Top-level cache structure.
+
+    Files loaded from disk stay as raw JSON dicts until first accessed
+    through get_file; in incremental runs most lookups start with
+    peek_file_hash, so files dropped from the review set (and, with a hash
+    match, everything up to the first issue replay) never pay from_dict.
+    """
 
     version: str = CACHE_VERSION
     timestamp: str = ""
     files: Dict[str, CachedFile] = field(default_factory=dict)
+    _raw_files: Dict[str, Dict[str, Any]] = field(default_factory=dict, init=False, repr=False)
+
+    def file_count(self) -> int:
+        """Number of files in the cache, materialized or not."""
+        return len(self.files) + len(self._raw_files)
+
+    def peek_file_hash(self, file_key: str) -> Optional[str]:
+        """Read a file's hash without deserializing its lines and segments."""
+        cached = self.files.get(file_key)
+        if cached is not None:
+            return cached.file_hash
+        raw = self._raw_files.get(file_key)
+        if raw is not None:
+            return raw.get("file_hash")
+        return None
+
+    def get_file(self, file_key: str) -> Optional[CachedFile]:
+        """Return the CachedFile, deserializing it on first access."""
+        cached = self.files.get(file_key)
+        if cached is None:
+            raw = self._raw_files.pop(file_key, None)
+            if raw is None:
+                return None
+            cached = CachedFile.from_dict(raw)
+            self.files[file_key] = cached
+        return cached
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dict."""
+        """Serialize to dict; never-materialized entries pass through as-is."""
+        files = {k: v.to_dict() for k, v in self.files.items()}
+        files.update(self._raw_files)
         return {
             "version": self.version,
             "timestamp": self.timestamp,
-            "files": {k: v.to_dict() for k, v in self.files.items()},
+            "files": files,
         }
 
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "ReviewCache":
-        """Deserialize from dict."""
-        return cls(
+        """Deserialize lazily: per-file payloads are kept raw until accessed."""
+        cache = cls(
             version=d.get("version", CACHE_VERSION),
             timestamp=d.get("timestamp", ""),
-            files={k: CachedFile.from_dict(v) for k, v in d.get("files", {}).items()},
         )
+        cache._raw_files = dict(d.get("files", {}))
+        return cache
+
+
+@dataclass(slots=True)
+class FileSnapshot:
+    """A file's content read once, shared between change analysis and cache building.
+
+    Only the raw bytes are read eagerly; the hash is computed straight from
+    them, and decoding plus line splitting happen lazily. On the common
+    unchanged-file path the hash comparison is the only work done.
+    """
 
+    path: Path
+    raw: bytes
+    content_hash: str
+    _content: Optional[str] = field(default=None, init=False, repr=False)
+    _lines: Optional[List[str]] = field(default=None, init=False, repr=False)
 
-@dataclass
+    @classmethod
+    def read(cls, path: Path) -> "FileSnapshot":
+        raw = path.read_bytes()
+        return cls(path=path, raw=raw, content_hash=compute_file_hash_bytes(raw))
+
+    @property
+    def content(self) -> str:
+        """Decode lazily; unchanged files never need the text."""
+        if self._content is None:
+            self._content = self.raw.decode("utf-8")
+        return self._content
+
+    @property
+    def lines(self) -> List[str]:
+        """Split lines lazily; unchanged files never need them."""
+        if self._lines is None:
+            self._lines = self.content.splitlines()
+        return self._lines
+
+
+@dataclass(slots=True)
 class LineChange:
     """Represents change status of a line."""
 
     current_line: int  # Line number in current file (1-based)
     cached_line: Optional[int]  # Line number in cached state (None if new)
     status: str  # "unchanged", "modified", "new"
-    content_hash: str
-
-
-def compute_line_hash(line: str) -> str:
-    """Compute hash of a line, normalizing whitespace."""
-    normalized = line.strip()
-    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
-
-
-def compute_file_hash(content: str) -> str:
-    """Compute hash of entire file content."""
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+    content_hash: int
+
+
+# These hashes are cache fingerprints, not security primitives, so the
+# much faster xxh3 is preferred when available. Line hashes live in memory
+# as 64-bit ints (cheaper to store and compare as dict keys than 16-char
+# strings) and are hex-formatted only at the JSON boundary, where the
+# width matches the old truncated SHA-256 values; file and segment hashes
+# stay hex strings since they go straight into JSON. Whole files are
+# hashed one call each — batching across files (multi-buffer SHA style)
+# buys nothing here because xxh3 saturates memory bandwidth per stream, and
+# the SHA-256 fallback already picks up SHA-NI through OpenSSL.
+# Lines are encoded first and trimmed as bytes: bytes.strip is a C-level
+# scan over the raw buffer, whereas str.strip walks codepoints and then
+# the result still has to be encoded. (Only ASCII whitespace is trimmed
+# at the bytes level; exotic Unicode whitespace now counts as content.)
+if _xxhash is not None:
+
+    def compute_line_hash(line: str) -> int:
+        """Compute hash of a line, normalizing whitespace."""
+        return _xxh3_64(line.encode("utf-8").strip()).intdigest()
+
+    def compute_file_hash(content: str) -> str:
+        """Compute hash of entire file content."""
+        return _xxh3_128(content.encode("utf-8")).hexdigest()
+
+    def compute_file_hash_bytes(data: bytes) -> str:
+        """Compute hash of entire file content given raw bytes."""
+        return _xxh3_128(data).hexdigest()
+
+    def compute_segment_hash(segment_text: str) -> str:
+        """Compute hash of a segment's text content."""
+        return _xxh3_64(segment_text.encode("utf-8")).hexdigest()
+
+else:
+
+    def compute_line_hash(line: str) -> int:
+        """Compute hash of a line, normalizing whitespace."""
+        digest = _sha256(line.encode("utf-8").strip()).digest()
+        return int.from_bytes(digest[:8], "big")
+
+    def compute_file_hash(content: str) -> str:
+        """Compute hash of entire file content."""
+        return _sha256(content.encode("utf-8")).hexdigest()[:32]
+
+    def compute_file_hash_bytes(data: bytes) -> str:
+        """Compute hash of entire file content given raw bytes."""
+        return _sha256(data).hexdigest()[:32]
+
+    def compute_segment_hash(segment_text: str) -> str:
+        """Compute hash of a segment's text content."""
+        return _sha256(segment_text.encode("utf-8")).hexdigest()[:16]
+
+
+def compute_line_hashes(lines: List[str]) -> List[int]:
+    """Compute hashes for all lines of a file in one pass.
+
+    Bulk entry point for the per-line loops in detect_changes and
+    build_cache_from_results; hashing a whole file in a single comprehension
+    keeps the per-line work inside the C hash implementation instead of
+    paying a Python function call per line. A compiled (e.g. Numba) kernel
+    was considered and rejected: CLaRA has no numpy/numba dependency and
+    the remaining per-line cost is already dominated by the C hash call.
+    """
+    if _xxh3_64 is not None:
+        xxh3_64 = _xxh3_64
+        return [xxh3_64(line.encode("utf-8").strip()).intdigest() for line in lines]
+    sha256 = _sha256
+    from_bytes = int.from_bytes
+    return [
+        from_bytes(sha256(line.encode("utf-8").strip()).digest()[:8], "big")
+        for line in lines
+    ]
 
 
-def compute_segment_hash(segment_text: str) -> str:
-    """Compute hash of a segment's text content."""
-    return hashlib.sha256(segment_text.encode("utf-8")).hexdigest()[:16]
+def _zst_path(path: Path) -> Path:
+    """Sibling path for the zstd-compressed form of the cache file."""
+    return path.with_name(path.name + ".zst")
 
 
 def load_cache(path: Path = DEFAULT_CACHE_PATH) -> Optional[ReviewCache]:
-    """Load cache from disk, return None if not exists or invalid."""
+    """Load cache from disk, return None if not exists or invalid.
+
+    The compressed form (written when zstandard is installed) is preferred;
+    the plain JSON file remains readable either way.
+    """
+    zst = _zst_path(path)
+    if _zstd is not None and zst.exists():
+        try:
+            data = jsonio.loads(_zstd.ZstdDecompressor().decompress(zst.read_bytes()))
+            if data.get("version") != CACHE_VERSION:
+                return None
+            return ReviewCache.from_dict(data)
+        except (ValueError, KeyError, _zstd.ZstdError):
+            return None
     if not path.exists():
         return None
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        # Parse straight from bytes; orjson decodes UTF-8 internally.
+        # Large caches are memory-mapped so the parser reads the page cache
+        # directly instead of a second in-heap copy of the whole file.
+        if path.stat().st_size >= _MMAP_THRESHOLD:
+            with path.open("rb") as fh:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        data = jsonio.loads(view)
+                    finally:
+                        view.release()
+        else:
+            data = jsonio.loads(path.read_bytes())
         if data.get("version") != CACHE_VERSION:
             return None  # Version mismatch, invalidate
         return ReviewCache.from_dict(data)
-    except (json.JSONDecodeError, KeyError):
+    except (ValueError, KeyError):
         return None
 
 
@@ -228,7 +442,20 @@ def save_cache(cache: ReviewCache, path: Path = DEFAULT_CACHE_PATH) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     cache.timestamp = datetime.utcnow().isoformat() + "Z"
     data = cache.to_dict()
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    # Compact bytes: no pretty-printing (the cache is machine-read only,
+    # and indent=2 roughly doubled the file) and no str round-trip.
+    # With zstandard available the JSON is additionally zstd-framed, which
+    # shrinks this highly repetitive payload several-fold; the stale
+    # counterpart file is removed so load_cache never sees a mixed pair.
+    raw = jsonio.dumps_bytes(data)
+    zst = _zst_path(path)
+    if _zstd is not None:
+        zst.write_bytes(_zstd.ZstdCompressor(level=3).compress(raw))
+        path.unlink(missing_ok=True)
+    else:
+        path.write_bytes(raw)
+        zst.unlink(missing_ok=True)
+    _ISSUE_POOL.clear()
 
 
 def detect_changes(
@@ -241,6 +468,8 @@ def detect_changes(
         - List of LineChange for each current line
         - Set of cached line numbers that were deleted
     """
+    current_hashes = compute_line_hashes(current_lines)
+
     if cached_file is None:
         # All lines are new
         return [
@@ -248,34 +477,32 @@ def detect_changes(
                 current_line=i + 1,
                 cached_line=None,
                 status="new",
-                content_hash=compute_line_hash(line),
+                content_hash=content_hash,
             )
-            for i, line in enumerate(current_lines)
+            for i, content_hash in enumerate(current_hashes)
         ], set()
 
-    # Build hash -> cached line numbers mapping
-    cached_hash_to_lines: Dict[str, List[int]] = {}
-    for line_no, cached_line in cached_file.lines.items():
-        cached_hash_to_lines.setdefault(cached_line.content_hash, []).append(line_no)
+    # Build hash -> queue of cached line numbers; popping the head gives the
+    # next available match in O(1) even when a hash repeats (blank lines,
+    # braces), instead of rescanning a candidate list per current line.
+    cached_hash_to_lines: Dict[int, deque] = {}
+    for line_no, cached_line in enumerate(cached_file.lines, start=1):
+        cached_hash_to_lines.setdefault(cached_line.content_hash, deque()).append(line_no)
 
     changes: List[LineChange] = []
-    used_cached_lines: Set[int] = set()
+    # Starts as every cached line; matches are discarded as they are
+    # claimed, so what remains at the end is exactly the deleted set.
+    unused_cached: Set[int] = set(range(1, len(cached_file.lines) + 1))
 
-    for i, line in enumerate(current_lines):
+    for i, content_hash in enumerate(current_hashes):
         current_no = i + 1
-        content_hash = compute_line_hash(line)
 
         # Try to find matching cached line
-        candidates = cached_hash_to_lines.get(content_hash, [])
-        matched_cached = None
-
-        for cached_no in candidates:
-            if cached_no not in used_cached_lines:
-                matched_cached = cached_no
-                used_cached_lines.add(cached_no)
-                break
+        dq = cached_hash_to_lines.get(content_hash)
+        matched_cached = dq.popleft() if dq else None
 
         if matched_cached is not None:
+            unused_cached.discard(matched_cached)
             status = "unchanged"
         else:
             status = "new"
@@ -289,16 +516,12 @@ def detect_changes(
             )
         )
 
-    # Find deleted lines
-    all_cached = set(cached_file.lines.keys())
-    deleted = all_cached - used_cached_lines
-
-    return changes, deleted
+    return changes, unused_cached
 
 
 def analyze_file_changes(
     file_path: Path, cache: Optional[ReviewCache]
-) -> Tuple[List[LineChange], Optional[CachedFile], bool]:
+) -> Tuple[List[LineChange], Optional[CachedFile], bool, FileSnapshot]:
     """
     Analyze a file for changes.
 
@@ -306,36 +529,64 @@ def analyze_file_changes(
         - List of LineChange objects
         - CachedFile if it existed
         - bool: True if file needs any checking at all
+        - FileSnapshot with the content read here, so callers can reuse it
+          (e.g. build_cache_from_results) instead of reading the file again
     """
-    content = file_path.read_text(encoding="utf-8")
-    current_hash = compute_file_hash(content)
-    lines = content.splitlines()
+    snapshot = FileSnapshot.read(file_path)
 
     cached_file = None
     file_key = str(file_path)
-    if cache and file_key in cache.files:
-        cached_file = cache.files[file_key]
-        # Quick check: if file hash unchanged, no work needed
-        if cached_file.file_hash == current_hash:
-            return [], cached_file, False
-
-    changes, _deleted = detect_changes(lines, cached_file)
+    if cache is not None:
+        # Quick check: if file hash unchanged, no work needed; the hash peek
+        # avoids deserializing the cached file just to compare one field.
+        cached_hash = cache.peek_file_hash(file_key)
+        if cached_hash is not None and cached_hash == snapshot.content_hash:
+            return [], cache.get_file(file_key), False, snapshot
+        cached_file = cache.get_file(file_key)
+
+    changes, _deleted = detect_changes(snapshot.lines, cached_file)
     needs_check = any(c.status == "new" for c in changes)
 
-    return changes, cached_file, needs_check
+    return changes, cached_file, needs_check, snapshot
+
+
+def analyze_files_changes(
+    paths: List[Path], cache: Optional[ReviewCache]
+) -> List[Tuple[List[LineChange], Optional[CachedFile], bool, FileSnapshot]]:
+    """Analyze several files concurrently, preserving input order.
+
+    Per-file work is read + decode + hash: the reads overlap in threads and
+    the hashing runs in C outside the GIL, so a thread pool is enough here
+    without the pickling cost a process pool would add for the cache.
+    """
+    if len(paths) <= 1:
+        return [analyze_file_changes(p, cache) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        return list(executor.map(lambda p: analyze_file_changes(p, cache), paths))
 
 
 def get_cached_issues_for_unchanged(
     file_path: str, changes: List[LineChange], cached_file: CachedFile
 ) -> List[Dict[str, Any]]:
-    """Get issues from cache for unchanged lines, with updated line numbers."""
+    """Get issues from cache for unchanged lines, with updated line numbers.
+
+    This is the hottest cache traversal; the interned issues keep it a flat
+    list walk. A columnar (numpy-style) issue table was considered and
+    rejected — CLaRA has no array dependency and the per-run issue counts
+    don't justify one.
+    """
     issues: List[Dict[str, Any]] = []
+    append = issues.append
+    cached_lines = cached_file.lines
+    line_count = len(cached_lines)
     for change in changes:
         if change.status == "unchanged" and change.cached_line:
-            cached_line = cached_file.lines.get(change.cached_line)
-            if cached_line:
-                for cached_issue in cached_line.issues:
-                    issues.append(cached_issue.to_full_issue(file_path, change.current_line))
+            if 0 < change.cached_line <= line_count:
+                line_issues = cached_lines[change.cached_line - 1].issues
+                if line_issues:
+                    current_line = change.current_line
+                    for cached_issue in line_issues:
+                        append(cached_issue.to_full_issue(file_path, current_line))
     return issues
 
 
@@ -351,6 +602,14 @@ def get_cached_llm_issues(
     """
     Filter segments and return cached LLM issues for unchanged segments.
 
+    The cache key is the hash of the whole segment text. Keying on
+    per-sentence hashes would let single-sentence edits reuse the rest of
+    a segment, but was rejected: segment boundaries are already
+    content-defined (see extract._chunk_sentences), so local edits only
+    invalidate the chunk they touch, and prompting the LLM with isolated
+    sentences both loses surrounding context and leaves no reliable way to
+    attribute returned issues back to one sentence.
+
     Returns:
         - List of segments that need fresh LLM review (new or changed)
         - List of cached issues for unchanged segments (with updated line numbers)
@@ -378,7 +637,7 @@ def get_cached_llm_issues(
 
 def issue_to_cached(issue: Dict[str, Any]) -> CachedIssue:
     """Convert a full issue dict to CachedIssue."""
-    return CachedIssue(
+    return _intern_issue(
         tool=issue.get("tool", "unknown"),
         type=issue.get("type", "generic"),
         col=issue.get("col", 0),
@@ -394,8 +653,14 @@ def build_cache_from_results(
     files: List[Path],
     issues: List[Dict[str, Any]],
     segments: Optional[List["Segment"]] = None,
+    snapshots: Optional[Dict[str, FileSnapshot]] = None,
 ) -> ReviewCache:
-    """Build new cache from review results."""
+    """Build new cache from review results.
+
+    When the caller already read the files (incremental mode hands over the
+    snapshots from analyze_file_changes), their content and hashes are
+    reused instead of re-reading and re-hashing everything.
+    """
     cache = ReviewCache()
 
     # Separate LLM issues from line-based issues
@@ -433,26 +698,29 @@ def build_cache_from_results(
             segment_cache.setdefault(segment.file, {})[seg_hash] = cached_segment
 
     for file_path in files:
-        content = file_path.read_text(encoding="utf-8")
-        lines = content.splitlines()
         file_key = str(file_path)
+        snapshot = snapshots.get(file_key) if snapshots else None
+        if snapshot is None:
+            snapshot = FileSnapshot.read(file_path)
+        lines = snapshot.lines
 
         cached_file = CachedFile(
-            file_hash=compute_file_hash(content),
+            file_hash=snapshot.content_hash,
             line_count=len(lines),
-            lines={},
+            lines=[],
             segments=segment_cache.get(file_key, {}),
         )
 
-        for i, line in enumerate(lines):
+        line_hashes = compute_line_hashes(lines)
+        for i, line_hash in enumerate(line_hashes):
             line_no = i + 1
             line_iss = issue_index.get((file_key, line_no), [])
 
             cached_line = CachedLine(
-                content_hash=compute_line_hash(line),
+                content_hash=line_hash,
                 issues=[issue_to_cached(iss) for iss in line_iss],
             )
-            cached_file.lines[line_no] = cached_line
+            cached_file.lines.append(cached_line)
 
         cache.files[file_key] = cached_file
 
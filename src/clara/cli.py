@@ -2,19 +2,23 @@ from __future__ import annotations
 
 import argparse
 import fnmatch
-import json
+import functools
+import os
+import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
 
 from .config import ClaraConfig, load_config
 from .extract import extract_segments
 from .report import normalize, summarize
-from .suppressions import apply_suppressions
-from . import adapters
+from .suppressions import _collect_suppressions, _match_suppression, _normalize_path
+from . import adapters, jsonio
 from .cache import (
     ReviewCache,
-    analyze_file_changes,
+    analyze_files_changes,
     build_cache_from_results,
     get_cached_issues_for_unchanged,
     get_cached_llm_issues,
@@ -41,6 +45,8 @@ def main() -> None:
 
     cfg = load_config("clara.toml")
     files = resolve_files(args.files, cfg)
+    # Stringified once; several phases key dicts and issue fields by this.
+    file_strs = [str(p) for p in files]
 
     if args.cmd == "fix":
         adapters.latexindent.fix(files, cfg)
@@ -75,38 +81,57 @@ def main() -> None:
     if args.cmd == "review-auto":
         cache = load_cache(DEFAULT_CACHE_PATH)
         if cache:
-            print(f"[cache] Loaded cache with {len(cache.files)} file(s)")
-
-    # Run checks (incremental if cache exists, otherwise full)
-    if args.cmd == "review-auto" and cache:
-        issues = run_incremental_checks(files, cfg, cache)
-    else:
-        issues = []
-        issues += adapters.latexindent.run(files, cfg)
-        issues += adapters.chktex.run(files, cfg)
-        issues += adapters.vale.run(files, cfg)
-        if cfg.checks.enable_codespell:
-            issues += adapters.codespell.run(files, cfg)
-        issues += adapters.languagetool.run(files, cfg, url_env="LT_URL")
+            print(f"[cache] Loaded cache with {cache.file_count()} file(s)")
 
     run_llm = args.with_llm and not args.fast
     if args.cmd == "review-fix":
         run_llm = True
     if args.cmd == "review-auto" and not cache:
         run_llm = True
+    llm_executor: Optional[ThreadPoolExecutor] = None
+    llm_future = None
+
+    # Segments are needed for the LLM pass and for cache building; the
+    # extraction is independent of lint results, so kick it off first and
+    # let it overlap the adapters' subprocess/HTTP waits below.
+    need_segments = run_llm or args.cmd == "review-auto"
+    extract_executor: Optional[ThreadPoolExecutor] = None
+    extract_future = None
+    if need_segments:
+        extract_executor = ThreadPoolExecutor(max_workers=1)
+        extract_future = extract_executor.submit(extract_segments, files, cfg)
+
+    # Run checks (incremental if cache exists, otherwise full)
+    snapshots: Dict[str, Any] = {}
+    if args.cmd == "review-auto" and cache:
+        issues, snapshots = run_incremental_checks(files, cfg, cache)
+    else:
+        checkers = [
+            adapters.latexindent.run,
+            adapters.chktex.run,
+            adapters.vale.run,
+            functools.partial(adapters.languagetool.run, url_env="LT_URL"),
+        ]
+        if cfg.checks.enable_codespell:
+            checkers.append(adapters.codespell.run)
+        issues = adapters.runner.run_all(checkers, files, cfg)
 
     # Track all segments for cache building (even if LLM doesn't run)
-    all_segments = extract_segments(files, cfg) if run_llm or args.cmd == "review-auto" else []
+    all_segments = extract_future.result() if extract_future else []
+    if extract_executor:
+        extract_executor.shutdown()
 
     if run_llm:
         # Filter segments using cache for incremental LLM review
         fresh_segments = all_segments
         if cache:
+            segments_by_file: Dict[str, List[Any]] = defaultdict(list)
+            for segment in all_segments:
+                segments_by_file[segment.file].append(segment)
             fresh_segments = []
-            for file_path in files:
-                file_key = str(file_path)
-                file_segments = [s for s in all_segments if s.file == file_key]
-                cached_file = cache.files.get(file_key)
+            for file_key in file_strs:
+                file_segments = segments_by_file.get(file_key, [])
+                cached_file = cache.get_file(file_key)
                 new_segs, cached_iss = get_cached_llm_issues(file_segments, cached_file)
                 fresh_segments.extend(new_segs)
                 issues.extend(cached_iss)
@@ -116,54 +141,62 @@ def main() -> None:
                 print(f"[cache] All {len(all_segments)} segment(s) cached, skipping LLM")
 
         if fresh_segments:
+            llm_run = None
             if cfg.llm.provider == "ollama":
-                issues += adapters.ollama.run(fresh_segments, cfg, url_env="OLLAMA_URL")
+                llm_run = functools.partial(adapters.ollama.run, url_env="OLLAMA_URL")
             elif cfg.llm.provider in ("openai", "lm-studio"):
-                issues += adapters.openai.run(fresh_segments, cfg, url_env="OPENAI_URL")
+                llm_run = functools.partial(adapters.openai.run, url_env="OPENAI_URL")
+            if llm_run is not None:
+                if args.cmd == "review-auto":
+                    # Adjudication of tool issues below doesn't depend on
+                    # LLM output; run the LLM call in the background and
+                    # collect it after adjudication.
+                    llm_executor = ThreadPoolExecutor(max_workers=1)
+                    llm_future = llm_executor.submit(llm_run, fresh_segments, cfg)
+                else:
+                    issues += llm_run(fresh_segments, cfg)
 
     if args.cmd == "review-fix":
-        normalized = [normalize(issue) for issue in issues]
-        active = apply_suppressions(normalized)
-        summary = summarize(active)
+        normalized, active, summary = _pipeline(issues)
         result = {"version": "1.0", "summary": summary, "issues": normalized}
         output_json(result, args.json_out)
         from .fixer import apply_fixes_from_issues, annotate_llm_comments
         apply_fixes_from_issues(active, cfg)
-        annotate_llm_comments(active, cfg, files=[str(p) for p in files])
+        annotate_llm_comments(active, cfg, files=file_strs)
     elif args.cmd == "review-auto":
         from .adjudicate import adjudicate_issues
         from .fixer import apply_adjudicated_fixes, annotate_llm_comments, apply_fixes_from_issues
-        normalized = [normalize(issue) for issue in issues]
-        active = apply_suppressions(normalized)
+        normalized, active, _ = _pipeline(issues)
+        # Runs while the LLM review (if any) is still in flight.
         adjudicated = adjudicate_issues(active, cfg)
+        if llm_future is not None:
+            llm_normalized, llm_active, _ = _pipeline(llm_future.result())
+            llm_executor.shutdown()
+            normalized.extend(llm_normalized)
+            adjudicated.extend(llm_active)
         apply_adjudicated_fixes(adjudicated)
-        accepted_non_llm = [
-            issue for issue in adjudicated
-            if issue.get("tool") != "llm"
-            and (issue.get("adjudication") or {}).get("accept")
-        ]
-        apply_fixes_from_issues(accepted_non_llm, cfg)
-        llm_issues = [i for i in adjudicated if i.get("tool") == "llm"]
-        annotate_llm_comments(llm_issues, cfg, files=[str(p) for p in files])
-        accepted = []
+        # One pass instead of three comprehensions over the same list: LLM
+        # issues always count as accepted, tool issues only when the
+        # adjudicator said so.
+        llm_issues: List[Dict[str, Any]] = []
+        accepted_non_llm: List[Dict[str, Any]] = []
         for issue in adjudicated:
             if issue.get("tool") == "llm":
-                accepted.append(issue)
-                continue
-            decision = issue.get("adjudication")
-            if decision and decision.get("accept"):
-                accepted.append(issue)
-        summary = summarize(accepted)
+                llm_issues.append(issue)
+            elif (issue.get("adjudication") or {}).get("accept"):
+                accepted_non_llm.append(issue)
+        apply_fixes_from_issues(accepted_non_llm, cfg)
+        annotate_llm_comments(llm_issues, cfg, files=file_strs)
+        summary = summarize(llm_issues + accepted_non_llm)
         result = {"version": "1.0", "summary": summary, "issues": normalized}
         output_json(result, args.json_out)
-        # Save cache for incremental mode (include segments for LLM caching)
-        new_cache = build_cache_from_results(files, normalized, all_segments)
+        # Save cache for incremental mode (include segments for LLM caching);
+        # snapshots avoid re-reading files the incremental pass already read.
+        new_cache = build_cache_from_results(files, normalized, all_segments, snapshots)
         save_cache(new_cache, DEFAULT_CACHE_PATH)
         print(f"[cache] Saved cache for {len(files)} file(s), {len(all_segments)} segment(s)")
     else:
-        normalized = [normalize(issue) for issue in issues]
-        active = apply_suppressions(normalized)
-        summary = summarize(active)
+        normalized, active, summary = _pipeline(issues)
         result = {"version": "1.0", "summary": summary, "issues": normalized}
         output_json(result, args.json_out)
 
@@ -181,82 +214,249 @@ def resolve_files(files: Sequence[str] | None, cfg: ClaraConfig) -> List[Path]:
 
 
 def discover(cfg: ClaraConfig, root: Path | None = None) -> List[Path]:
+    """Find files matching the include patterns, minus the excluded ones.
+
+    Instead of ``root.glob(pattern)`` per pattern — which walks the whole
+    tree even for ``chapters/**/*.tex`` — each pattern is split into its
+    literal directory prefix and a glob remainder, patterns sharing a prefix
+    are fused into one scan, and the walk itself uses ``os.scandir`` so the
+    cached DirEntry type spares a stat per path. Excluded directories are
+    pruned during the walk rather than filtered afterwards, so subtrees like
+    ``out/**`` are never entered.
+    """
     root = root or Path(".")
-    candidates: set[Path] = set()
-    for pattern in cfg.paths.include:
-        candidates.update(p for p in root.glob(pattern) if p.is_file())
-    filtered = [
-        p for p in candidates if not _is_excluded(p, cfg.paths.exclude, root=root)
-    ]
-    return sorted(filtered)
-
+    excluded_re, excluded_prefixes = _compile_excludes(tuple(cfg.paths.exclude))
 
-def _is_excluded(path: Path, patterns: Iterable[str], root: Path) -> bool:
-    rel = path.relative_to(root)
-    rel_str = str(rel)
-    for pattern in patterns:
-        if fnmatch.fnmatch(rel_str, pattern):
-            return True
-        # Handle directory globs manually (e.g., out/**)
-        if pattern.endswith("/**") and rel_str.startswith(pattern[:-3]):
-            return True
-    return False
+    grouped: Dict[str, List[str]] = {}
+    for pattern in cfg.paths.include:
+        prefix, remainder = _split_literal_prefix(pattern)
+        grouped.setdefault(prefix, []).append(remainder)
+
+    found: Dict[str, None] = {}
+    for prefix, remainders in grouped.items():
+        base = root / prefix if prefix else root
+        if not base.is_dir():
+            continue
+        matcher = _compile_includes(tuple(remainders))
+        recurse = any("/" in rem for rem in remainders)
+        _scan_tree(str(base), prefix, "", matcher, recurse,
+                   excluded_re, excluded_prefixes, found)
+    return sorted(root / rel for rel in found)
+
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _split_literal_prefix(pattern: str) -> tuple[str, str]:
+    """Split a glob into its longest literal directory prefix and the rest.
+
+    ``chapters/**/*.tex`` -> ``("chapters", "**/*.tex")``; a pattern with no
+    literal directories keeps an empty prefix.
+    """
+    parts = pattern.split("/")
+    i = 0
+    while i < len(parts) - 1 and not _GLOB_CHARS.intersection(parts[i]):
+        i += 1
+    return "/".join(parts[:i]), "/".join(parts[i:])
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_includes(remainders: tuple[str, ...]) -> re.Pattern:
+    """Compile glob remainders into one alternation with glob semantics.
+
+    Unlike ``fnmatch.translate``, ``*`` and ``?`` here do not cross ``/``
+    and ``**`` matches zero or more directories, mirroring ``Path.glob``.
+    """
+    return re.compile("|".join(_glob_to_regex(rem) for rem in remainders))
+
+
+def _glob_to_regex(pattern: str) -> str:
+    parts = pattern.split("/")
+    out = []
+    for idx, part in enumerate(parts):
+        last = idx == len(parts) - 1
+        if part == "**":
+            # Path.glob yields only directories for a trailing "**", so
+            # such a pattern discovers no files; (?!) keeps that parity.
+            out.append(r"(?!)" if last else r"(?:[^/]+/)*")
+            continue
+        piece = "".join(
+            "[^/]*" if ch == "*" else "[^/]" if ch == "?" else re.escape(ch)
+            for ch in part
+        )
+        out.append(piece if last else piece + "/")
+    return rf"(?s:{''.join(out)})\Z"
+
+
+def _scan_tree(
+    dir_path: str,
+    rel: str,
+    rel_from_base: str,
+    matcher: re.Pattern,
+    recurse: bool,
+    excluded_re: re.Pattern | None,
+    excluded_prefixes: tuple[str, ...],
+    found: Dict[str, None],
+) -> None:
+    try:
+        entries = os.scandir(dir_path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            entry_rel = f"{rel}/{entry.name}" if rel else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if not recurse or _is_excluded(entry_rel + "/", excluded_re, excluded_prefixes):
+                    continue
+                sub_rel = f"{rel_from_base}/{entry.name}" if rel_from_base else entry.name
+                _scan_tree(entry.path, entry_rel, sub_rel, matcher, recurse,
+                           excluded_re, excluded_prefixes, found)
+            elif entry.is_file():
+                candidate = f"{rel_from_base}/{entry.name}" if rel_from_base else entry.name
+                if matcher.match(candidate) and not _is_excluded(
+                    entry_rel, excluded_re, excluded_prefixes
+                ):
+                    found[entry_rel] = None
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_excludes(patterns: tuple[str, ...]) -> tuple[re.Pattern | None, tuple[str, ...]]:
+    """Fold the exclude list into one alternation plus a prefix tuple.
+
+    One compiled regex match replaces a Python-level fnmatch loop per path;
+    directory globs like ``out/**`` become prefixes checked with the
+    C-level ``str.startswith``.
+    """
+    translated = [fnmatch.translate(p) for p in patterns]
+    combined = re.compile("|".join(translated)) if translated else None
+    prefixes = tuple(p[:-3] for p in patterns if p.endswith("/**"))
+    return combined, prefixes
+
+
+def _is_excluded(
+    rel_str: str,
+    excluded_re: re.Pattern | None,
+    excluded_prefixes: tuple[str, ...],
+) -> bool:
+    if excluded_re is not None and excluded_re.match(rel_str):
+        return True
+    # Handle directory globs manually (e.g., out/**)
+    return bool(excluded_prefixes) and rel_str.startswith(excluded_prefixes)
+
+
+def _pipeline(
+    issues: List[Dict[str, Any]],
+) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, int]]:
+    """Normalize, suppress and summarize the issue list in two passes.
+
+    Fuses what used to be three traversals (normalize comprehension,
+    apply_suppressions, summarize): the first pass normalizes and collects
+    the files whose suppression directives must be scanned, the second
+    marks suppressed issues, builds the active list and counts severities
+    in one go.
+    """
+    normalized: List[Dict[str, Any]] = []
+    file_paths = set()
+    for issue in issues:
+        item = normalize(issue)
+        normalized.append(item)
+        if item["file"]:
+            file_paths.add(_normalize_path(item["file"]))
+
+    suppressions = _collect_suppressions(file_paths)
+    active: List[Dict[str, Any]] = []
+    summary = {"errors": 0, "warnings": 0, "notes": 0}
+    for item in normalized:
+        suppression = _match_suppression(item, suppressions)
+        if suppression:
+            item["suppressed"] = True
+            item["suppression"] = suppression
+            continue
+        active.append(item)
+        severity = item["severity"]
+        if severity == "error":
+            summary["errors"] += 1
+        elif severity == "warning":
+            summary["warnings"] += 1
+        else:
+            summary["notes"] += 1
+    return normalized, active, summary
 
 
 def output_json(payload: dict, destination: str | None) -> None:
+    data = jsonio.dumps_bytes_pretty(payload)
     if destination:
         path = Path(destination)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        path.write_bytes(data)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        # Drain the buffered text layer first so earlier print() output
+        # can't land after or inside the JSON document on a pipe.
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
 
 
 def run_incremental_checks(
     files: List[Path],
     cfg: ClaraConfig,
     cache: Optional[ReviewCache],
-) -> List[Dict[str, Any]]:
-    """Run checks incrementally, using cache for unchanged lines."""
+) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Run checks incrementally, using cache for unchanged lines.
+
+    Returns the merged issues plus the file snapshots read during analysis,
+    which the caller hands to build_cache_from_results to skip a re-read.
+    """
     all_issues: List[Dict[str, Any]] = []
     files_to_check: List[Path] = []
     file_changes: Dict[str, List[Any]] = {}
     cached_files: Dict[str, Any] = {}
+    snapshots: Dict[str, Any] = {}
 
-    # Phase 1: Analyze all files for changes
-    for file_path in files:
-        changes, cached_file, needs_check = analyze_file_changes(file_path, cache)
+    # Phase 1: Analyze all files for changes (reads/hashes run concurrently)
+    analyses = analyze_files_changes(files, cache)
+    for file_path, (changes, cached_file, needs_check, snapshot) in zip(files, analyses):
+        path_str = str(file_path)
+        snapshots[path_str] = snapshot
 
         if not needs_check and cached_file:
             # File unchanged - load all issues from cache
             cached_count = 0
-            for line_no, cached_line in cached_file.lines.items():
+            for line_no, cached_line in enumerate(cached_file.lines, start=1):
                 for issue in cached_line.issues:
-                    all_issues.append(issue.to_full_issue(str(file_path), line_no))
+                    all_issues.append(issue.to_full_issue(path_str, line_no))
                     cached_count += 1
             print(f"[cache] {file_path}: unchanged, {cached_count} cached issues")
         else:
             files_to_check.append(file_path)
-            file_changes[str(file_path)] = changes
+            file_changes[path_str] = changes
             if cached_file:
-                cached_files[str(file_path)] = cached_file
+                cached_files[path_str] = cached_file
 
     if not files_to_check:
         print("[cache] No changes detected, using cached results.")
-        return all_issues
+        return all_issues, snapshots
 
     print(f"[cache] Checking {len(files_to_check)} changed file(s)...")
 
     # Phase 2: Run adapters on files that need checking
-    fresh_issues: List[Dict[str, Any]] = []
-    fresh_issues += adapters.latexindent.run(files_to_check, cfg)
-    fresh_issues += adapters.chktex.run(files_to_check, cfg)
-    fresh_issues += adapters.vale.run(files_to_check, cfg)
+    checkers = [
+        adapters.latexindent.run,
+        adapters.chktex.run,
+        adapters.vale.run,
+        functools.partial(adapters.languagetool.run, url_env="LT_URL"),
+    ]
     if cfg.checks.enable_codespell:
-        fresh_issues += adapters.codespell.run(files_to_check, cfg)
-    fresh_issues += adapters.languagetool.run(files_to_check, cfg, url_env="LT_URL")
+        checkers.append(adapters.codespell.run)
+    fresh_issues: List[Dict[str, Any]] = adapters.runner.run_all(checkers, files_to_check, cfg)
+
+    # Phase 3: Filter fresh issues and merge with cached. Index issues by
+    # file once so each file only scans its own bucket (O(F+I), not O(F*I)).
+    issues_by_file: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for issue in fresh_issues:
+        issues_by_file[issue.get("file", "")].append(issue)
 
-    # Phase 3: Filter fresh issues and merge with cached
     for file_path in files_to_check:
         path_str = str(file_path)
         changes = file_changes.get(path_str, [])
@@ -265,8 +465,8 @@ def run_incremental_checks(
 
         # Fresh issues for changed lines only
         fresh_count = 0
-        for issue in fresh_issues:
-            if issue.get("file") == path_str and issue.get("line") in changed_lines:
+        for issue in issues_by_file.get(path_str, ()):
+            if issue.get("line") in changed_lines:
                 all_issues.append(issue)
                 fresh_count += 1
 
@@ -279,7 +479,7 @@ def run_incremental_checks(
 
         print(f"[cache] {file_path}: {fresh_count} new, {cached_count} cached")
 
-    return all_issues
+    return all_issues, snapshots
 
 
 if __name__ == "__main__":
@@ -1,5 +1,15 @@
+"""Configuration models for clara.toml.
+
+These stay on pydantic deliberately: msgspec.Struct decodes faster, but
+config parsing happens once per process and is memoized by mtime in
+load_config, so the decode cost is already off the hot path — not worth a
+second modelling dependency or losing the Field range validators.
+"""
+
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -24,6 +34,9 @@ class LLMConfig(BaseModel):
     max_tokens: Optional[int] = None
     temperature: Optional[float] = None
     timeout_seconds: Optional[int] = 120
+    concurrency: int = 4
+    batch_size: int = 8
+    min_segment_chars: int = 40
 
 
 class LanguagesConfig(BaseModel):
@@ -45,6 +58,17 @@ class ClaraConfig(BaseModel):
 
 
 def load_config(path: str | Path) -> ClaraConfig:
-    """Load configuration from TOML file."""
-    data = tomllib.loads(Path(path).read_text(encoding="utf-8"))
+    """Load configuration from TOML file.
+
+    Parsed configs are cached per (path, mtime) so repeated in-process
+    loads — e.g. when the CLI is driven from a watch loop — skip the TOML
+    parse and pydantic validation; editing the file invalidates the entry.
+    """
+    resolved = os.path.abspath(os.fspath(path))
+    return _load_config_cached(resolved, os.stat(resolved).st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _load_config_cached(resolved_path: str, mtime_ns: int) -> ClaraConfig:
+    data = tomllib.loads(Path(resolved_path).read_text(encoding="utf-8"))
     return ClaraConfig.model_validate(data)
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Tuple
 import re
 from pylatexenc.latex2text import LatexNodes2Text
 
+_WS_RE = re.compile(r"\s+")
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_COMMENT_RE = re.compile(r"(?<!\\)%[^\n]*")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Segment:
     text: str
     file: str
@@ -15,54 +23,101 @@ class Segment:
 
 
 def extract_segments(files: Iterable[str], cfg) -> List[Segment]:
-    """Extract text segments removing math environments and chunking the result."""
-    segments: List[Segment] = []
-    for path in files:
-        content = Path(path).read_text(encoding="utf-8")
-        masked = _mask_preamble_and_comments(content)
-        lines = _extract_line_texts(masked)
-        if not lines:
-            continue
-        sentences = _sentences_from_lines(lines)
-        if not sentences:
-            continue
-        for chunk_text, start_line in _chunk_sentences(sentences):
-            segments.append(Segment(text=chunk_text, file=str(path), start_line=start_line))
+    """Extract text segments removing math environments and chunking the result.
+
+    pylatexenc parsing is pure-Python and CPU-bound, so with several files
+    the work fans out over a process pool (threads would serialize on the
+    GIL). A single file takes the serial path to skip the pool startup and
+    keep the in-process conversion cache warm.
+    """
+    paths = [str(p) for p in files]
+    if len(paths) <= 1:
+        segments: List[Segment] = []
+        for path in paths:
+            segments.extend(_extract_one(path))
+        return segments
+
+    segments = []
+    max_workers = min(len(paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for file_segments in executor.map(_extract_one, paths):
+            segments.extend(file_segments)
     return segments
 
 
+def _extract_one(path: str) -> List[Segment]:
+    """Extract the segments of a single file (runs in a pool worker)."""
+    # read_bytes + one decode skips the io-stack newline translation that
+    # read_text pays on every call.
+    content = Path(path).read_bytes().decode("utf-8")
+    masked = _mask_preamble_and_comments(content)
+    lines = _extract_line_texts(masked)
+    if not lines:
+        return []
+    sentences = _sentences_from_lines(lines)
+    if not sentences:
+        return []
+    return [
+        Segment(text=chunk_text, file=path, start_line=start_line)
+        for chunk_text, start_line in _chunk_sentences(sentences)
+    ]
+
+
+_CONVERTER = LatexNodes2Text(math_mode="remove")
+
+
+@lru_cache(maxsize=8192)
+def _line_to_text(line: str) -> str:
+    """Convert one LaTeX line to normalized plain text.
+
+    Memoized because LaTeX sources repeat many lines verbatim (\\item,
+    section markers, boilerplate), and pylatexenc's parse is by far the
+    most expensive step per line. The shared converter is safe here since
+    extraction runs on a single thread.
+    """
+    try:
+        text = _CONVERTER.latex_to_text(line)
+    except Exception:
+        text = line
+    return _WS_RE.sub(" ", text).strip()
+
+
 def _extract_line_texts(masked: str) -> List[Tuple[str, int]]:
     """Convert each line to plain text and keep line numbers."""
-    converter = LatexNodes2Text(math_mode="remove")
     results: List[Tuple[str, int]] = []
     for idx, line in enumerate(masked.splitlines(), start=1):
         if not line.strip():
             continue
-        try:
-            text = converter.latex_to_text(line)
-        except Exception:
-            text = line
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _line_to_text(line)
         if text:
             results.append((text, idx))
     return results
 
 
 def _sentences_from_lines(lines: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
-    """Split line texts into sentences while keeping the start line."""
+    """Split line texts into sentences while keeping the start line.
+
+    The pending sentence is kept as a list of fragments and only joined and
+    re-split once a terminator is actually buffered, so a long paragraph
+    costs O(L) instead of re-concatenating and re-splitting the whole
+    buffer on every line.
+    """
     sentences: List[Tuple[str, int]] = []
-    buffer = ""
+    buf_parts: List[str] = []
     start_line = None
+    has_terminator = False
     for text, line_no in lines:
         if not text:
             continue
-        if not buffer:
+        if not buf_parts:
             start_line = line_no
-            buffer = text
-        else:
-            buffer = f"{buffer} {text}"
+        buf_parts.append(text)
+        if not has_terminator:
+            has_terminator = "." in text or "!" in text or "?" in text
+        if not has_terminator:
+            continue
 
-        parts = re.split(r"(?<=[.!?])\s+", buffer)
+        parts = _SENT_SPLIT_RE.split(" ".join(buf_parts))
         if len(parts) == 1:
             continue
         for part in parts[:-1]:
@@ -70,12 +125,16 @@ def _sentences_from_lines(lines: List[Tuple[str, int]]) -> List[Tuple[str, int]]
             if sentence:
                 sentences.append((sentence, start_line or line_no))
             start_line = line_no
-        buffer = parts[-1].strip()
-        if not buffer:
+        remainder = parts[-1].strip()
+        buf_parts = [remainder] if remainder else []
+        if not remainder:
             start_line = None
+        has_terminator = bool(remainder) and (
+            "." in remainder or "!" in remainder or "?" in remainder
+        )
 
-    if buffer:
-        sentences.append((buffer, start_line or lines[-1][1]))
+    if buf_parts:
+        sentences.append((" ".join(buf_parts), start_line or lines[-1][1]))
     return sentences
 
 
@@ -83,7 +142,7 @@ def _chunk_sentences(
     sentences: List[Tuple[str, int]],
     *,
     target_max_chars: int = 4000,
-    overlap_sentences: int = 1,
+    min_chunk_chars: int = 1000,
 ) -> List[Tuple[str, int]]:
     """
     Combine sentences into larger chunks to keep LLM calls bounded.
@@ -91,6 +150,13 @@ def _chunk_sentences(
     We intentionally approximate "token" limits using character counts to avoid
     adding a tokenizer dependency. This keeps the number of LLM requests low
     (especially important for local CPU inference).
+
+    Chunk boundaries are content-defined: once a chunk reaches
+    min_chunk_chars, it is cut at the next sentence whose hash lands in a
+    1-in-8 bucket (target_max_chars stays a hard cap). Cutting on sentence
+    content rather than a running offset keeps downstream chunks stable
+    when prose is inserted earlier in the file, so the segment cache keeps
+    matching unchanged chunks across edits.
     """
     if not sentences:
         return []
@@ -116,25 +182,35 @@ def _chunk_sentences(
 
         add_len = len(s) + (1 if current else 0)
         if current and current_len + add_len > target_max_chars:
-            tail = current[-overlap_sentences:] if overlap_sentences > 0 else []
             flush()
-            current = tail.copy()
-            current_len = sum(len(t) for t, _ in current) + max(0, len(current) - 1)
-
-        if not current:
-            current = [(s, line_no)]
-            current_len = len(s)
-        else:
-            current.append((s, line_no))
-            current_len += add_len
+            add_len = len(s)
+        current.append((s, line_no))
+        current_len += add_len
+        if current_len >= min_chunk_chars and _is_cut_point(s):
+            flush()
 
     flush()
     return chunks
 
 
+def _is_cut_point(sentence: str) -> bool:
+    """True when a sentence's hash lands in the boundary bucket (1 in 8)."""
+    return hashlib.blake2s(sentence.encode("utf-8"), digest_size=4).digest()[0] & 7 == 0
+
+
 def _mask_preamble_and_comments(content: str) -> str:
     """Mask preamble and comments to avoid LLM feedback on metadata/comments."""
-    masked = _mask_comments(content)
+    # Comment-free fragments without document structure (common for
+    # generated or included files) have nothing to mask.
+    if (
+        "%" not in content
+        and r"\maketitle" not in content
+        and r"\begin{document}" not in content
+        and r"\end{document}" not in content
+    ):
+        return content
+
+    masked = _mask_comments(content) if "%" in content else content
 
     start = masked.find(r"\begin{document}")
     if start != -1:
@@ -153,33 +229,13 @@ def _mask_preamble_and_comments(content: str) -> str:
 
 def _mask_comments(text: str) -> str:
     """Replace LaTeX comments with spaces while preserving line structure."""
-    out_lines = []
-    for line in text.splitlines(keepends=True):
-        idx = _find_unescaped_percent(line)
-        if idx == -1:
-            out_lines.append(line)
-            continue
-        newline = "\n" if line.endswith("\n") else ""
-        visible = line[:idx]
-        masked = visible + (" " * (len(line) - idx - len(newline))) + newline
-        out_lines.append(masked)
-    return "".join(out_lines)
-
-
-def _find_unescaped_percent(line: str) -> int:
-    i = 0
-    while True:
-        idx = line.find("%", i)
-        if idx == -1:
-            return -1
-        if idx > 0 and line[idx - 1] == "\\":
-            i = idx + 1
-            continue
-        return idx
+    # One pass over the whole document; the match never crosses a newline.
+    return _COMMENT_RE.sub(lambda m: " " * len(m.group(0)), text)
 
 
 def _mask_non_newline(text: str) -> str:
-    return re.sub(r"[^\n]", " ", text)
+    # Pure C string ops beat the regex engine for this character-class swap.
+    return "\n".join(" " * len(part) for part in text.split("\n"))
 
 
 def _mask_macro(text: str, macro: str) -> str:
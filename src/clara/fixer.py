@@ -1,20 +1,81 @@
 from __future__ import annotations
 
-import json
 import re
 import difflib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Iterable
 
 from .config import ClaraConfig
 from .prompts import load_prompt
+from . import jsonio
+
+try:
+    from rapidfuzz import fuzz as _fuzz
+except ImportError:  # pragma: no cover - optional speedup
+    _fuzz = None
 
 ANNOTATION_PREFIX = "CLaRA-LLM"
 MAX_ANNOTATION_LEN = 160
 INCLUDE_RATIONALE = False
 FIX_PREFIX = "CLaRA-FIX"
 FIX_INLINE_RE = re.compile(rf"\s*%\s*{re.escape(FIX_PREFIX)}:.*$")
+# Whole-file flavor of FIX_INLINE_RE: strips stale fix comments from the
+# blob in one C-side pass instead of a regex call per line.
+FIX_INLINE_BULK_RE = re.compile(rf"(?m)[ \t]*%\s*{re.escape(FIX_PREFIX)}:.*$")
 ANNOTATION_RE = re.compile(rf"^\s*%+\s*{re.escape(ANNOTATION_PREFIX)}:")
+# Whole-file flavor of ANNOTATION_RE: deletes matching lines in one C-side
+# pass instead of a per-line match loop.
+ANNOTATION_LINE_RE = re.compile(rf"(?m)^[ \t]*%+[ \t]*{re.escape(ANNOTATION_PREFIX)}:.*\n?")
+# Greedy span from the first '[' to the last ']' (same recovery as the LLM adapters).
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+LATEX_CMD_RE = re.compile(r"\\[A-Za-z@]+")
+# Commands plus structural delimiters in one alternation, so the safety
+# check scans each candidate once instead of four times.
+_SAFETY_SCAN_RE = re.compile(r"\\[A-Za-z@]+|[{}$]")
+WS_RE = re.compile(r"\s+")
+
+_PRINT_LOCK = threading.Lock()
+
+_HTTP_LOCK = threading.Lock()
+_HTTP: Any = None
+
+
+def _http_client() -> Any:
+    """Shared keep-alive httpx.Client for fix requests.
+
+    Pooled sockets avoid a fresh TCP handshake per call; created lazily
+    so importing the module stays dependency-free, and closed at exit.
+    """
+    global _HTTP
+    with _HTTP_LOCK:
+        if _HTTP is None:
+            import atexit
+            import httpx
+
+            _HTTP = httpx.Client(
+                timeout=httpx.Timeout(60.0),
+                limits=httpx.Limits(max_keepalive_connections=16),
+            )
+            atexit.register(_HTTP.close)
+        return _HTTP
+
+
+def _log(msg: str) -> None:
+    """Print a whole line atomically; _process_file runs on pool threads."""
+    with _PRINT_LOCK:
+        print(msg)
+
+
+def _read_lines(fpath: Path) -> List[str]:
+    # read_bytes + one decode skips the io stack's universal-newline
+    # translation; splitlines still understands \r\n.
+    return fpath.read_bytes().decode("utf-8").splitlines()
+
+
+def _write_lines(fpath: Path, lines: List[str]) -> None:
+    fpath.write_bytes("\n".join(lines).encode("utf-8"))
 
 
 def load_issues(issues_path: str) -> List[Dict[str, Any]]:
@@ -23,9 +84,11 @@ def load_issues(issues_path: str) -> List[Dict[str, Any]]:
         print(f"No issues file found at {issues_path}. Run 'make check' first.")
         return []
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        # Parse the raw bytes directly; jsonio (orjson-backed when
+        # available) skips the bytes->str decode the stdlib path needs.
+        data = jsonio.loads(path.read_bytes())
         return data.get("issues", [])
-    except json.JSONDecodeError:
+    except ValueError:
         print("Invalid JSON in issues file.")
         return []
 
@@ -42,26 +105,43 @@ def apply_fixes(issues_path: str, cfg: ClaraConfig) -> None:
 
 
 def apply_fixes_from_issues(issues: Iterable[Dict[str, Any]], cfg: ClaraConfig) -> None:
-    """Apply fixes from an in-memory issues list."""
-    fixable_issues = [
-        i for i in issues
-        if not i.get("suppressed")
-        and i.get("tool") in ("languagetool", "codespell")
-        and i.get("file")
-        and i.get("line")
-    ]
-
-    if not fixable_issues:
+    """Apply fixes from an issues iterable.
+
+    Filters and groups in a single pass so callers can hand in any
+    iterable without an intermediate fixable-issues list being built;
+    non-fixable entries are dropped as they stream by. A full streaming
+    JSON parser (ijson-style) was considered for the file-based entry
+    point but rejected: issue reports are small and orjson already parses
+    them in one cheap call.
+    """
+    files_map: Dict[str, List[Dict[str, Any]]] = {}
+    for issue in issues:
+        if (
+            not issue.get("suppressed")
+            and issue.get("tool") in ("languagetool", "codespell")
+            and issue.get("file")
+            and issue.get("line")
+        ):
+            files_map.setdefault(issue["file"], []).append(issue)
+
+    if not files_map:
         print("No fixable content issues found.")
         return
 
-    files_map: Dict[str, List[Dict[str, Any]]] = {}
-    for issue in fixable_issues:
-        fname = issue["file"]
-        files_map.setdefault(fname, []).append(issue)
-
-    for fname, file_issues in files_map.items():
-        _process_file(fname, file_issues, cfg)
+    # Each file blocks on the LLM endpoint; fix several files concurrently
+    # up to the configured LLM concurrency.
+    if len(files_map) == 1:
+        for fname, file_issues in files_map.items():
+            _process_file(fname, file_issues, cfg)
+        return
+    workers = min(len(files_map), cfg.llm.concurrency or 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_process_file, fname, file_issues, cfg)
+            for fname, file_issues in files_map.items()
+        ]
+        for future in futures:
+            future.result()
 
 
 def annotate_llm_comments(
@@ -71,26 +151,27 @@ def annotate_llm_comments(
 ) -> None:
     """Insert LLM suggestions as LaTeX comments next to affected lines."""
     _ = cfg
-    if files is None:
-        files = {i.get("file") for i in issues if i.get("file")}
-    for fname in files:
+    # One pass pulls each field once: the set of files to clean and the
+    # per-file LLM issue groups come out of the same loop instead of
+    # re-probing "file"/"tool"/"suppressed" per pass.
+    issue_files: Dict[str, None] = {}
+    files_map: Dict[str, List[Dict[str, Any]]] = {}
+    for issue in issues:
+        fname = issue.get("file")
+        if not fname:
+            continue
+        issue_files[fname] = None
+        if issue.get("suppressed") or issue.get("tool") != "llm" or not issue.get("line"):
+            continue
+        files_map.setdefault(fname, []).append(issue)
+
+    for fname in (issue_files if files is None else files):
         _remove_existing_comments(fname)
 
-    llm_issues = [
-        i for i in issues
-        if not i.get("suppressed")
-        and i.get("tool") == "llm"
-        and i.get("file")
-        and i.get("line")
-    ]
-    if not llm_issues:
+    if not files_map:
         print("No LLM annotations to add.")
         return
 
-    files_map: Dict[str, List[Dict[str, Any]]] = {}
-    for issue in llm_issues:
-        files_map.setdefault(issue["file"], []).append(issue)
-
     for fname, file_issues in files_map.items():
         _annotate_file(fname, file_issues)
 
@@ -105,11 +186,12 @@ def apply_adjudicated_fixes(issues: Iterable[Dict[str, Any]]) -> None:
         if not adj.get("accept"):
             continue
         fix = adj.get("fix")
-        if not fix or not issue.get("file") or not issue.get("line"):
+        fname = issue.get("file")
+        if not fix or not fname or not issue.get("line"):
             continue
         issue["fix"] = fix
         issue["comment"] = adj.get("comment", "")
-        grouped.setdefault(issue["file"], []).append(issue)
+        grouped.setdefault(fname, []).append(issue)
 
     for fname, file_issues in grouped.items():
         _apply_inline_fixes(fname, file_issues)
@@ -120,20 +202,10 @@ def _process_file(fname: str, issues: List[Dict], cfg: ClaraConfig):
     if not fpath.exists():
         return
 
-    lines = fpath.read_text(encoding="utf-8").splitlines()
-    
-    # We need to process from bottom to top to keep line numbers valid?
-    # Actually, replacing a line with a fixed line might not change line count if it's 1:1.
-    # But LLM might merge/split lines. 
-    # Safest strategy: 
-    # 1. Identify "bad lines".
-    # 2. Group issues by line index.
-    # 3. Fix line by line (or small blocks). 
-    
-    # Sort issues by line index descending
-    issues.sort(key=lambda x: x.get("line", 0), reverse=True)
-    
-    # Group by line
+    lines = _read_lines(fpath)
+
+    # LLM responses might merge/split lines, so candidate fixes are applied
+    # per line, bottom to top, after safety checks.
     lines_issues: Dict[int, List[Dict]] = {}
     for i in issues:
         ln = int(i.get("line", 0)) - 1  # 0-indexed
@@ -143,72 +215,154 @@ def _process_file(fname: str, issues: List[Dict], cfg: ClaraConfig):
             lines_issues[ln] = []
         lines_issues[ln].append(i)
 
-    # Load prompt
     system_prompt = load_prompt("prompt_fix", cfg, default="Fix the error.")
 
-    # Iterate over affected lines (descending order)
-    for line_idx in sorted(lines_issues.keys(), reverse=True):
-        original_text = lines[line_idx]
-        current_issues = lines_issues[line_idx]
-        
-        # Construct error description
-        error_descs = []
-        for issue in current_issues:
-            msg = f"- [{issue['tool']}] {issue['message']}"
-            if issue.get("suggestion"):
-                msg += f" (Suggestion: {issue['suggestion']})"
-            error_descs.append(msg)
-        
-        error_block = "\n".join(error_descs)
-        
-        user_msg = f"Original Text:\n{original_text}\n\nErrors:\n{error_block}\n\nCorrected Text:"
-        
-        # Call LLM
-        # We need a simple "generate text" call, reusing adapters is tricky as they expect segments.
-        # We'll make a direct helper call here or extend adapters.
-        # Let's use a helper that dispatches based on config.
-        
-        print(f"Fixing {fname}:{line_idx+1}...")
+    # All affected lines of a file go to the model in one request; the
+    # HTTP round-trip and prompt warmup amortize across lines. A
+    # malformed batch response falls back to one request per line.
+    order = sorted(lines_issues.keys())
+    candidates: Dict[int, str] = {}
+    if order:
+        _log(f"Fixing {len(order)} line(s) in {fname}...")
+        batch = _fix_lines_batched(cfg, system_prompt, lines, lines_issues, order)
+        if batch is not None:
+            candidates = batch
+        else:
+            _log("  Batch response unusable, retrying line by line")
+            for line_idx in order:
+                user_msg = (
+                    f"Original Text:\n{lines[line_idx]}\n\n"
+                    f"Errors:\n{_error_block(lines_issues[line_idx])}\n\nCorrected Text:"
+                )
+                try:
+                    candidates[line_idx] = _call_llm_for_fix(
+                        cfg, system_prompt, user_msg, single_line=True
+                    )
+                except Exception as e:
+                    _log(f"  {fname}:{line_idx + 1} failed: {e}")
+
+    # order is already sorted; walking it backwards keeps the bottom-to-top
+    # application without sorting the candidate keys a second time.
+    applied = 0
+    for line_idx in reversed(order):
+        if line_idx in candidates:
+            applied += _apply_candidate_fix(lines, line_idx, candidates[line_idx], cfg)
+
+    # Write back only when a fix actually landed; rejected candidates
+    # should not touch the file's mtime.
+    if applied:
+        _write_lines(fpath, lines)
+        _log(f"Applied fixes to {fname}")
+    elif order:
+        _log(f"No fixes applied to {fname}")
+
+
+def _error_block(issues: List[Dict]) -> str:
+    error_descs = []
+    for issue in issues:
+        msg = f"- [{issue['tool']}] {issue['message']}"
+        if issue.get("suggestion"):
+            msg += f" (Suggestion: {issue['suggestion']})"
+        error_descs.append(msg)
+    return "\n".join(error_descs)
+
+
+def _fix_lines_batched(
+    cfg: ClaraConfig,
+    system_prompt: str,
+    lines: List[str],
+    lines_issues: Dict[int, List[Dict]],
+    order: List[int],
+) -> Dict[int, str] | None:
+    """Request fixes for all affected lines at once.
+
+    Returns a line-index -> candidate-fix map, or None when the request
+    failed or the response couldn't be parsed (callers then fall back to
+    per-line requests).
+    """
+    blocks = []
+    for n, line_idx in enumerate(order, start=1):
+        blocks.append(
+            f"{n}: {lines[line_idx]}\nErrors:\n{_error_block(lines_issues[line_idx])}"
+        )
+    user_msg = (
+        "Fix each numbered line below. Reply with a JSON array of objects "
+        '[{"n": <line number>, "fix": "<corrected line>"}] and nothing else.\n\n'
+        + "\n\n".join(blocks)
+    )
+    try:
+        content = _call_llm_for_fix(cfg, system_prompt, user_msg)
+    except Exception as e:
+        _log(f"  Batch fix request failed: {e}")
+        return None
+    if "</think>" in content:
+        content = content.split("</think>")[-1]
+
+    try:
+        data = jsonio.loads(content)
+    except ValueError:
+        match = _JSON_ARRAY_RE.search(content)
+        if not match:
+            return None
         try:
-            fixed_text = _call_llm_for_fix(cfg, system_prompt, user_msg)
-            
-            # Clean response: strip CoT <think> blocks and extra text
-            if "</think>" in fixed_text:
-                fixed_text = fixed_text.split("</think>")[-1]
-            
-            # Sanity check: if empty, don't replace
-            fixed_text = fixed_text.strip()
-            if "\n" in fixed_text:
-                print("  Skipped (multi-line response)")
-            elif fixed_text:
-                if _is_safe_fix(original_text, fixed_text, cfg):
-                    # Build comment: <original> -> <fixed>
-                    comment_text = f"{original_text.strip()} -> {fixed_text.strip()}"
-                    comment_text = _truncate_comment(comment_text, max_len=200)
-                    # Insert comment above the fixed line, then the fixed line
-                    lines[line_idx] = f"% {FIX_PREFIX}: {comment_text}\n{fixed_text.strip()}"
-                    print(f"  Fixed (added comment)")
-                else:
-                    print("  Skipped (unsafe fix)")
-            else:
-                print(f"  Skipped (empty response)")
-                
-        except Exception as e:
-            print(f"  Failed to fix: {e}")
-
-    # Write back
-    fpath.write_text("\n".join(lines), encoding="utf-8")
-    print(f"Applied fixes to {fname}")
+            data = jsonio.loads(match.group())
+        except ValueError:
+            return None
+    if isinstance(data, dict):
+        # Some endpoints wrap the array, e.g. {"fixes": [...]}.
+        for key in ("fixes", "items", "results"):
+            if isinstance(data.get(key), list):
+                data = data[key]
+                break
+    if not isinstance(data, list):
+        return None
+
+    fixes: Dict[int, str] = {}
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+        try:
+            n = int(item.get("n"))
+        except (TypeError, ValueError):
+            continue
+        fix = item.get("fix")
+        if 1 <= n <= len(order) and isinstance(fix, str):
+            fixes[order[n - 1]] = fix
+    return fixes
+
+
+def _apply_candidate_fix(lines: List[str], line_idx: int, fixed_text: str, cfg: ClaraConfig) -> bool:
+    """Apply one candidate fix in place; True when the line was changed."""
+    original_text = lines[line_idx]
+    # Clean response: strip CoT <think> blocks and extra text
+    if "</think>" in fixed_text:
+        fixed_text = fixed_text.split("</think>")[-1]
+    fixed_text = fixed_text.strip()
+    if "\n" in fixed_text:
+        _log(f"  Line {line_idx + 1}: skipped (multi-line response)")
+    elif fixed_text:
+        if _is_safe_fix(original_text, fixed_text, cfg):
+            # Build comment: <original> -> <fixed>
+            comment_text = f"{original_text.strip()} -> {fixed_text}"
+            comment_text = _truncate_comment(comment_text, max_len=200)
+            # Insert comment above the fixed line, then the fixed line
+            lines[line_idx] = f"% {FIX_PREFIX}: {comment_text}\n{fixed_text}"
+            _log(f"  Line {line_idx + 1}: fixed (added comment)")
+            return True
+        _log(f"  Line {line_idx + 1}: skipped (unsafe fix)")
+    else:
+        _log(f"  Line {line_idx + 1}: skipped (empty response)")
+    return False
 
 
 def _remove_existing_comments(fname: str) -> None:
     fpath = Path(fname)
     if not fpath.exists():
         return
-    lines = fpath.read_text(encoding="utf-8").splitlines()
-    base_lines = [line for line in lines if not ANNOTATION_RE.match(line)]
-    if base_lines != lines:
-        fpath.write_text("\n".join(base_lines), encoding="utf-8")
+    text = fpath.read_bytes().decode("utf-8")
+    stripped = ANNOTATION_LINE_RE.sub("", text)
+    if stripped != text:
+        fpath.write_bytes(stripped.encode("utf-8"))
 
 
 def _annotate_file(fname: str, issues: List[Dict[str, Any]]) -> None:
@@ -216,18 +370,20 @@ def _annotate_file(fname: str, issues: List[Dict[str, Any]]) -> None:
     if not fpath.exists():
         return
 
-    lines = fpath.read_text(encoding="utf-8").splitlines()
+    lines = _read_lines(fpath)
     if not lines:
         return
 
-    removed_before: List[int] = []
-    removed_count = 0
-    for line in lines:
+    # Single pass: filter annotation lines and record where each surviving
+    # original line lands, instead of a cumulative-sum pre-pass plus a
+    # second filtering comprehension.
+    base_lines: List[str] = []
+    orig_to_base: Dict[int, int] = {}
+    for idx, line in enumerate(lines, start=1):
         if ANNOTATION_RE.match(line):
-            removed_count += 1
-        removed_before.append(removed_count)
-
-    base_lines = [line for line in lines if not ANNOTATION_RE.match(line)]
+            continue
+        orig_to_base[idx] = len(base_lines) + 1
+        base_lines.append(line)
 
     grouped: Dict[int, List[Dict[str, Any]]] = {}
     for issue in issues:
@@ -235,26 +391,30 @@ def _annotate_file(fname: str, issues: List[Dict[str, Any]]) -> None:
             orig_line = int(issue.get("line", 0))
         except (TypeError, ValueError):
             continue
-        if orig_line <= 0 or orig_line > len(lines):
-            continue
-        adjusted = orig_line - removed_before[orig_line - 1]
-        if adjusted <= 0 or adjusted > len(base_lines):
+        adjusted = orig_to_base.get(orig_line)
+        if adjusted is None:
+            # Out of range, or the issue pointed at a removed annotation.
             continue
         grouped.setdefault(adjusted, []).append(issue)
 
     if not grouped:
         return
 
-    for line_no in sorted(grouped.keys(), reverse=True):
+    # Annotations replace single list slots, so no index shifts occur and
+    # the lines can be edited in any order.
+    annotated = 0
+    for line_no, issues_for_line in grouped.items():
         idx = line_no - 1
-        issues_for_line = grouped[line_no]
         inline = _build_inline_comment(issues_for_line)
         if not inline:
             continue
         base_lines[idx] = f"{base_lines[idx]} {inline}"
+        annotated += 1
 
-    fpath.write_text("\n".join(base_lines), encoding="utf-8")
-    print(f"Added LLM annotations to {fname}")
+    # All comments empty means nothing changed; leave the file untouched.
+    if annotated:
+        _write_lines(fpath, base_lines)
+        print(f"Added LLM annotations to {fname}")
 
 
 def _build_comment_lines(issues: List[Dict[str, Any]], indent: str) -> List[str]:
@@ -275,7 +435,7 @@ def _build_comment_lines(issues: List[Dict[str, Any]], indent: str) -> List[str]
 
 
 def _sanitize_comment(text: str) -> str:
-    return re.sub(r"\s+", " ", str(text)).strip()
+    return WS_RE.sub(" ", str(text)).strip()
 
 
 def _truncate_comment(text: str, max_len: int = MAX_ANNOTATION_LEN) -> str:
@@ -304,13 +464,23 @@ def _build_inline_comment(issues: List[Dict[str, Any]]) -> str:
 
 
 def _apply_inline_fixes(fname: str, issues: List[Dict[str, Any]]) -> None:
+    if not issues:
+        return
     fpath = Path(fname)
     if not fpath.exists():
         return
-    lines = fpath.read_text(encoding="utf-8").splitlines()
-    if not lines:
+    content = fpath.read_bytes().decode("utf-8")
+    if not content:
         return
-    lines = [_strip_fix_inline(line) for line in lines]
+    # Cheap substring gate before the strip pass: most files carry no
+    # stale fix comments, and when they do one whole-blob sub replaces
+    # the regex call per line.
+    dirty = False
+    if FIX_PREFIX in content:
+        stripped = FIX_INLINE_BULK_RE.sub("", content)
+        dirty = stripped != content
+        content = stripped
+    lines = content.splitlines()
 
     by_line: Dict[int, List[Dict[str, Any]]] = {}
     for issue in issues:
@@ -322,24 +492,24 @@ def _apply_inline_fixes(fname: str, issues: List[Dict[str, Any]]) -> None:
             continue
         by_line.setdefault(line_no, []).append(issue)
 
-    for line_no in sorted(by_line.keys(), reverse=True):
+    # Each fix replaces one list slot in place, so line order is irrelevant
+    # and the descending sort over the keys is unnecessary.
+    for line_no, line_issues in by_line.items():
         idx = line_no - 1
         original = lines[idx]
         # Apply the first fix per line for now.
-        fix = by_line[line_no][0].get("fix", "").strip()
+        fix = line_issues[0].get("fix", "").strip()
         if not fix:
             continue
-        comment = _build_fix_inline_comment(by_line[line_no][0], original, fix)
+        comment = _build_fix_inline_comment(line_issues[0], original, fix)
         lines[idx] = f"{fix} {comment}".rstrip()
-        by_line[line_no][0]["fixed"] = True
-        by_line[line_no][0]["severity"] = "note"
-
-    fpath.write_text("\n".join(lines), encoding="utf-8")
-    print(f"Applied adjudicated fixes to {fname}")
-
+        line_issues[0]["fixed"] = True
+        line_issues[0]["severity"] = "note"
+        dirty = True
 
-def _strip_fix_inline(line: str) -> str:
-    return re.sub(FIX_INLINE_RE, "", line).rstrip()
+    if dirty:
+        _write_lines(fpath, lines)
+        print(f"Applied adjudicated fixes to {fname}")
 
 
 def _build_fix_inline_comment(issue: Dict[str, Any], original: str, fixed: str) -> str:
@@ -361,30 +531,58 @@ def _is_safe_fix(original: str, fixed: str, cfg: ClaraConfig) -> bool:
         return False
     if "%" in fixed and "%" not in original:
         return False
-    if original.count("{") != fixed.count("{") or original.count("}") != fixed.count("}"):
+    # Cheapest rejections first: integer comparisons, then the command
+    # regex, and the similarity scan only for candidates that survive.
+    orig_len = len(original)
+    max_delta = max(10, int(orig_len * cfg.fixer.max_length_delta_ratio))
+    if abs(len(fixed) - orig_len) > max_delta:
         return False
-    if original.count("$") != fixed.count("$"):
+    if _structure_signature(original) != _structure_signature(fixed):
         return False
-    if _latex_commands(original) != _latex_commands(fixed):
-        return False
-    ratio = difflib.SequenceMatcher(a=original, b=fixed).ratio()
-    if ratio < cfg.fixer.safety_ratio:
-        return False
-    max_delta = max(10, int(len(original) * cfg.fixer.max_length_delta_ratio))
-    if abs(len(fixed) - len(original)) > max_delta:
-        return False
-    return True
+    # rapidfuzz computes the same normalized similarity in C; difflib's
+    # pure-Python SequenceMatcher stays as the fallback.
+    if _fuzz is not None:
+        ratio = _fuzz.ratio(original, fixed) / 100.0
+    else:
+        ratio = difflib.SequenceMatcher(a=original, b=fixed).ratio()
+    return ratio >= cfg.fixer.safety_ratio
 
 
-def _latex_commands(text: str) -> list[str]:
-    return re.findall(r"\\[A-Za-z@]+", text)
+def _structure_signature(text: str) -> tuple[int, int, int, List[str]]:
+    """Brace/dollar counts and the command sequence from a single scan.
 
+    Equivalent to three str.count calls plus a LATEX_CMD_RE.findall, but
+    the combined alternation walks the string once.
+    """
+    opens = closes = dollars = 0
+    commands: List[str] = []
+    for match in _SAFETY_SCAN_RE.finditer(text):
+        token = match.group()
+        if token == "{":
+            opens += 1
+        elif token == "}":
+            closes += 1
+        elif token == "$":
+            dollars += 1
+        else:
+            commands.append(token)
+    return opens, closes, dollars, commands
 
-def _call_llm_for_fix(cfg: ClaraConfig, sys_prompt: str, user_msg: str) -> str:
+
+def _call_llm_for_fix(
+    cfg: ClaraConfig, sys_prompt: str, user_msg: str, *, single_line: bool = False
+) -> str:
+    """Request a completion for one fix prompt.
+
+    With ``single_line=True`` the response is streamed and the connection
+    is dropped as soon as a newline shows up in the generated text —
+    multi-line candidates are rejected downstream anyway, so there is no
+    point waiting for the rest of the generation. Batched requests need
+    the complete JSON array and keep the buffered path.
+    """
     # Minimal adapter dispatch
-    import httpx
     import os
-    
+
     if cfg.llm.provider in ("openai", "lm-studio"):
         base_url = cfg.llm.api_url or "http://localhost:1234/v1"
         url = f"{base_url.rstrip('/')}/chat/completions"
@@ -394,20 +592,22 @@ def _call_llm_for_fix(cfg: ClaraConfig, sys_prompt: str, user_msg: str) -> str:
                 {"role": "system", "content": sys_prompt},
                 {"role": "user", "content": user_msg}
             ],
-            "stream": False
+            "stream": single_line
         }
         if cfg.llm.temperature is not None:
             payload["temperature"] = cfg.llm.temperature
-            
+
         headers = {}
         if os.getenv("OPENAI_API_KEY"):
             headers["Authorization"] = f"Bearer {os.getenv('OPENAI_API_KEY')}"
-            
+
         timeout = cfg.llm.timeout_seconds or 60
-        resp = httpx.post(url, json=payload, headers=headers, timeout=timeout)
+        if single_line:
+            return _stream_chat(url, payload, headers, timeout, _openai_delta)
+        resp = _http_client().post(url, json=payload, headers=headers, timeout=timeout)
         resp.raise_for_status()
         return resp.json()["choices"][0]["message"]["content"]
-        
+
     elif cfg.llm.provider == "ollama":
         base_url = os.getenv("OLLAMA_URL", "http://localhost:11434")
         url = f"{base_url.rstrip('/')}/api/chat"
@@ -417,15 +617,77 @@ def _call_llm_for_fix(cfg: ClaraConfig, sys_prompt: str, user_msg: str) -> str:
                 {"role": "system", "content": sys_prompt},
                 {"role": "user", "content": user_msg}
             ],
-            "stream": False,
+            "stream": single_line,
             "options": {}
         }
         if cfg.llm.temperature is not None:
             payload["options"]["temperature"] = cfg.llm.temperature
 
         timeout = cfg.llm.timeout_seconds or 60
-        resp = httpx.post(url, json=payload, timeout=timeout)
+        if single_line:
+            return _stream_chat(url, payload, {}, timeout, _ollama_delta)
+        resp = _http_client().post(url, json=payload, timeout=timeout)
         resp.raise_for_status()
         return resp.json()["message"]["content"]
-    
+
     return ""
+
+
+def _stream_chat(
+    url: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str],
+    timeout: float,
+    extract: Any,
+) -> str:
+    """Accumulate streamed chat deltas, aborting on a multi-line answer.
+
+    Handles both SSE framing (``data: {...}`` lines, ``[DONE]`` sentinel;
+    OpenAI/LM Studio) and plain NDJSON (Ollama); ``extract`` pulls the
+    text delta out of one parsed event.
+
+    The abort mirrors _apply_candidate_fix's acceptance check: a leading
+    ``<think>`` block is skipped over (reasoning models stream newlines
+    there long before the answer starts) and the stream is only dropped
+    once non-whitespace content follows a newline in the answer itself.
+    That keeps accept/reject decisions identical to the buffered path
+    regardless of how the endpoint happens to chunk the tokens: the
+    returned text still carries the interior newline, so the candidate is
+    rejected downstream, while a bare trailing newline never aborts.
+    """
+    acc = ""
+    client = _http_client()
+    with client.stream("POST", url, json=payload, headers=headers, timeout=timeout) as resp:
+        resp.raise_for_status()
+        for raw in resp.iter_lines():
+            line = raw.strip()
+            if not line:
+                continue
+            if line.startswith("data:"):
+                line = line[5:].strip()
+            if line == "[DONE]":
+                break
+            try:
+                chunk = extract(jsonio.loads(line))
+            except (ValueError, LookupError, TypeError):
+                continue
+            if not chunk:
+                continue
+            acc += chunk
+            probe = acc.lstrip()
+            if probe.startswith("<think>"):
+                if "</think>" not in acc:
+                    continue
+                probe = acc.split("</think>")[-1]
+            if "\n" in probe.strip():
+                # Closing the context manager cancels the generation.
+                break
+    return acc
+
+
+def _openai_delta(event: Dict[str, Any]) -> str:
+    return event["choices"][0].get("delta", {}).get("content") or ""
+
+
+def _ollama_delta(event: Dict[str, Any]) -> str:
+    return event.get("message", {}).get("content") or ""
@@ -0,0 +1,49 @@
+"""JSON helpers backed by orjson when available, stdlib json otherwise.
+
+orjson parses and serializes several times faster than the stdlib for the
+payload sizes LanguageTool and the LLM endpoints produce. It is an optional
+dependency: local runs without it fall back transparently. Both parsers
+raise ValueError subclasses on malformed input, so callers should catch
+ValueError rather than json.JSONDecodeError.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+if _orjson is not None:
+
+    def loads(data: str | bytes | memoryview) -> Any:
+        return _orjson.loads(data)
+
+    def dumps(obj: Any) -> str:
+        return _orjson.dumps(obj).decode()
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return _orjson.dumps(obj)
+
+    def dumps_bytes_pretty(obj: Any) -> bytes:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+
+else:
+
+    def loads(data: str | bytes | memoryview) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def dumps_bytes_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
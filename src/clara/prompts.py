@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
 
 from .config import ClaraConfig
@@ -10,17 +12,29 @@ def is_english(cfg: ClaraConfig) -> bool:
     return primary.startswith("en")
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_prompt(path: str, mtime: float) -> str:
+    _ = mtime  # cache key only; invalidates when the file changes
+    return Path(path).read_text(encoding="utf-8")
+
+
 def load_prompt(basename: str, cfg: ClaraConfig, default: str = "") -> str:
     """
     Load a prompt file, selecting an English variant when primary language is en-*.
     Falls back to the non-suffixed prompt if the localized file is missing.
     """
     suffix = "_en" if is_english(cfg) else ""
-    candidate = Path(f"configs/{basename}{suffix}.txt")
-    if not candidate.exists() and suffix:
-        candidate = Path(f"configs/{basename}.txt")
-    if candidate.exists():
-        return candidate.read_text(encoding="utf-8")
+    # One stat per candidate doubles as existence probe and cache key;
+    # dict.fromkeys drops the duplicate when there is no suffix.
+    candidates = dict.fromkeys(
+        (f"configs/{basename}{suffix}.txt", f"configs/{basename}.txt")
+    )
+    for candidate in candidates:
+        try:
+            mtime = os.stat(candidate).st_mtime
+        except OSError:
+            continue
+        return _cached_prompt(candidate, mtime)
     return default
 
 